@@ -1,14 +1,52 @@
 
+import json
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List
+
 import google.generativeai as genai
-import os
 from config import settings
 
-print(f"Checking models with key: {settings.GEMINI_API_KEY[:5]}...")
-genai.configure(api_key=settings.GEMINI_API_KEY)
+CACHE_FILE = Path.home() / ".cache" / "aadhaar_pulse" / "models.json"
+
+
+@lru_cache(maxsize=None)
+def get_generate_content_models() -> tuple:
+    """
+    List Gemini models supporting generateContent.
+
+    Results are cached in-process and persisted to a local JSON file,
+    so repeat CLI runs within CACHE_TTL_SECONDS skip the list_models RPC.
+    """
+    if CACHE_FILE.exists():
+        age = time.time() - CACHE_FILE.stat().st_mtime
+        if age < settings.CACHE_TTL_SECONDS:
+            try:
+                return tuple(json.loads(CACHE_FILE.read_text()))
+            except (ValueError, OSError):
+                pass  # Stale/corrupt cache - fall through to the RPC
+
+    genai.configure(api_key=settings.GEMINI_API_KEY)
+    models: List[str] = [
+        m.name
+        for m in genai.list_models()
+        if 'generateContent' in m.supported_generation_methods
+    ]
+
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(models))
+    except OSError:
+        pass  # Cache write is best-effort
+
+    return tuple(models)
+
 
-try:
-    for m in genai.list_models():
-        if 'generateContent' in m.supported_generation_methods:
-            print(m.name)
-except Exception as e:
-    print(f"Error: {e}")
+if __name__ == "__main__":
+    print(f"Checking models with key: {settings.GEMINI_API_KEY[:5]}...")
+    try:
+        for name in get_generate_content_models():
+            print(name)
+    except Exception as e:
+        print(f"Error: {e}")
@@ -3,11 +3,13 @@ Aadhaar Pulse - Backend Configuration
 Government-Grade Analytics Platform
 """
 import os
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 from typing import Optional
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
     # Environment
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
@@ -40,22 +42,18 @@ class Settings(BaseSettings):
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-2.5-flash"
     
-    # CORS - Allow Vercel deployments
-    CORS_ORIGINS: list = [
+    # CORS - stable origins as a frozenset (O(1) membership checks);
+    # Vercel preview deployments are matched by the compiled regex below
+    # so new previews don't need entries added here.
+    CORS_ORIGINS: tuple = (
         "http://localhost:3000",
         "http://127.0.0.1:3000",
-        "https://web-ashy-eight-32.vercel.app",
-        "https://web-naggelsi8-balaraj74s-projects.vercel.app",
-        "https://web-6z6zng1vn-balaraj74s-projects.vercel.app",
         "https://aadhaar-pulse.vercel.app",
         "https://aadhaar-pulse-web.vercel.app",
-    ]
-    
-    class Config:
-        env_file = ".env"
-        extra = "ignore"
+    )
+    CORS_ORIGIN_REGEX: str = r"^https://(web-[a-z0-9-]+|aadhaar-pulse(-web)?)\.vercel\.app$"
 
-@lru_cache()
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     return Settings()
 
@@ -13,179 +13,364 @@ This API provides:
 - Insight generation
 - Policy recommendations
 """
+import asyncio
+import hashlib
+import importlib
 import logging
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+import orjson
 
 from config import settings
-from routers import (
-    overview_router,
-    enrolments_router,
-    updates_router,
-    anomalies_router,
-    forecasts_router,
-    insights_router,
-    recommendations_router,
-    geography_router,
-    ai_router,
-)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Attribute names present on every LogRecord - anything else was passed
+# via extra={...} and gets serialized into the structured payload.
+_LOG_RECORD_DEFAULTS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime"}
+
+
+class ORJSONFormatter(logging.Formatter):
+    """Structured JSON log formatter backed by orjson"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _LOG_RECORD_DEFAULTS:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
+# Configure logging - structured JSON, serialized only when emitted
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(ORJSONFormatter())
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifecycle manager"""
-    logger.info("=" * 60)
-    logger.info("🚀 Starting Aadhaar Pulse API")
-    logger.info(f"   Environment: {settings.ENVIRONMENT}")
-    logger.info(f"   Version: {settings.API_VERSION}")
-    logger.info("=" * 60)
-    
-    # Initialize services
-    logger.info("📊 Initializing data repository...")
-    from services.data_repository import aadhaar_repository
-    logger.info(f"   ✅ Data repository initialized")
-    
-    logger.info("🔍 Initializing analytics engine...")
-    from services.analytics_service import analytics_service
-    logger.info(f"   ✅ Analytics service ready")
-    
-    logger.info("⚠️  Initializing anomaly detection...")
-    from services.anomaly_engine import anomaly_engine
-    logger.info(f"   ✅ Anomaly engine ready")
-    
-    logger.info("📈 Initializing forecasting engine...")
-    from services.forecast_engine import forecasting_engine
-    logger.info(f"   ✅ Forecasting engine ready")
-    
-    logger.info("💡 Initializing insight engine...")
-    from services.insight_engine import insight_engine
-    logger.info(f"   ✅ Insight engine ready")
-    
-    logger.info("🤖 Initializing Gemini AI...")
-    from services.gemini_service import gemini_service
-    if gemini_service.is_available():
-        logger.info(f"   ✅ Gemini AI ready (gemini-2.5-flash-preview-05-20)")
-    else:
-        logger.warning(f"   ⚠️ Gemini AI not available (check API key)")
-    
-    logger.info("✨ Aadhaar Pulse API is ready!")
-    logger.info("=" * 60)
-    
-    yield
-    
-    logger.info("Shutting down Aadhaar Pulse API...")
-
-
-# Create FastAPI app
-app = FastAPI(
-    title=settings.API_TITLE,
-    description=__doc__,
-    version=settings.API_VERSION,
-    lifespan=lifespan,
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
+async def _deferred_init(app: FastAPI):
+    """
+    Heavy service initialization, run as a background task after the
+    socket is bound. Keeps port binding instant so platform health
+    checks (Fly.io/Kubernetes) don't report false "not listening".
+    """
+    try:
+        # Initialize services
+        from services.data_repository import aadhaar_repository
+        from services.analytics_service import analytics_service
+        from services.anomaly_engine import anomaly_engine
+        from services.forecast_engine import forecasting_engine
+        from services.insight_engine import insight_engine
+        from services.gemini_service import gemini_service
+
+        # Register the heavy routers now that their service imports are warm
+        _register_routers(app)
+
+        # Drop any OpenAPI schema cached during the init window - a hit
+        # on /docs before this point would otherwise pin a routerless
+        # schema for the life of the process
+        app.openapi_schema = None
+
+        # Prime the analytics/anomaly memos before flipping readiness so
+        # the first user request lands on warm caches
+        from services.data_initializer import initialize_data
+        await initialize_data()
+
+        app.state.ready = True
+        logger.info(
+            "startup_complete",
+            extra={
+                "env": settings.ENVIRONMENT,
+                "version": settings.API_VERSION,
+                "gemini": gemini_service.is_available(),
+            },
+        )
+    except Exception:
+        logger.exception("startup_failed")
+        raise
+
 
-# CORS middleware - Allow all origins for public API
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=False,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# Router modules, loaded lazily so importing main.py stays cheap
+_ROUTER_MODULES = (
+    "overview",
+    "enrolments",
+    "updates",
+    "anomalies",
+    "forecasts",
+    "insights",
+    "recommendations",
+    "geography",
+    "ai_analytics",
 )
 
-# Include routers
-app.include_router(overview_router, prefix="/api/v1")
-app.include_router(enrolments_router, prefix="/api/v1")
-app.include_router(updates_router, prefix="/api/v1")
-app.include_router(anomalies_router, prefix="/api/v1")
-app.include_router(forecasts_router, prefix="/api/v1")
-app.include_router(insights_router, prefix="/api/v1")
-app.include_router(recommendations_router, prefix="/api/v1")
-app.include_router(geography_router, prefix="/api/v1")
-app.include_router(ai_router, prefix="/api/v1")
+
+def _register_routers(app: FastAPI):
+    """Include all API routers (imported lazily from deferred init)"""
+    for name in _ROUTER_MODULES:
+        module = importlib.import_module(f"routers.{name}")
+        app.include_router(module.router, prefix=settings.API_PREFIX)
+
+
+def _make_lifespan():
+    """Build the application lifecycle manager"""
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        app.state.ready = False
+        task = asyncio.create_task(_deferred_init(app))
+
+        yield
+
+        if not task.done():
+            task.cancel()
+
+        # Release pooled upstream clients that were actually created
+        import sys
+
+        client_module = sys.modules.get("services.data_gov_client")
+        if client_module is not None:
+            await client_module.data_gov_client.aclose()
+
+        repo_module = sys.modules.get("services.data_repository")
+        if repo_module is not None:
+            await repo_module.aadhaar_repository.fetcher.aclose()
+
+        logger.info("Shutting down Aadhaar Pulse API...")
+
+    return lifespan
+
+
+class ConditionalGetMiddleware(BaseHTTPMiddleware):
+    """
+    Weak-ETag revalidation plus a short response-byte cache for
+    read-only API responses.
+
+    Every 200 GET under the API prefix gets a blake2b ETag and a short
+    Cache-Control window; clients polling with If-None-Match are
+    answered with a bodyless 304, which skips serialization and egress
+    entirely. The serialized bytes are also cached per path+query for
+    RESPONSE_CACHE_TTL, so repeat requests within the window skip the
+    handler altogether. Streaming responses (no Content-Length) pass
+    through untouched, as do endpoints that set their own ETag.
+    """
+
+    RESPONSE_CACHE_TTL = 15.0
+    CACHE_CONTROL = "public, max-age=15, stale-while-revalidate=60"
+
+    def __init__(self, app):
+        super().__init__(app)
+        # path?query -> (body, etag, headers), in-process equivalent
+        # of a shared response cache for this single-replica deployment
+        from services.ttl_cache import TTLCache
+        self._responses = TTLCache(maxsize=128, ttl_seconds=self.RESPONSE_CACHE_TTL)
+
+    def _conditional(self, request: Request, body: bytes, etag: str, headers: dict) -> Response:
+        if request.headers.get("if-none-match") == etag:
+            return Response(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": self.CACHE_CONTROL},
+            )
+        return Response(content=body, headers=headers)
+
+    async def dispatch(self, request: Request, call_next):
+        cacheable = request.method == "GET" and request.url.path.startswith("/api/")
+        # Accept participates in the key: routes that content-negotiate
+        # (e.g. /geography/states Arrow vs JSON) must never replay one
+        # format's bytes to the other's clients
+        cache_key = (
+            f"{request.url.path}?{request.url.query}|{request.headers.get('accept', '')}"
+            if cacheable
+            else ""
+        )
+
+        if cacheable:
+            cached = self._responses.get(cache_key)
+            if cached is not None:
+                return self._conditional(request, *cached)
+
+        response = await call_next(request)
+        if (
+            not cacheable
+            or response.status_code != 200
+            or "etag" in response.headers
+            or "content-length" not in response.headers
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = 'W/"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        # Carry the handler's headers (Content-Type lives only in the
+        # header mapping on streamed responses) into the rebuilt 200
+        headers = dict(response.headers)
+        headers["ETag"] = etag
+        headers["Cache-Control"] = self.CACHE_CONTROL
+        self._responses.put(cache_key, (body, etag, headers))
+        return self._conditional(request, body, etag, headers)
+
+
+def create_app() -> FastAPI:
+    """
+    Create the lightweight application shell.
+
+    Only cheap wiring happens here (middleware, health probes, root);
+    everything that touches data or external APIs runs in
+    ``_deferred_init`` after the socket binds.
+    """
+    app = FastAPI(
+        title=settings.API_TITLE,
+        description=__doc__,
+        version=settings.API_VERSION,
+        lifespan=_make_lifespan(),
+        default_response_class=ORJSONResponse,
+        docs_url="/docs",
+        redoc_url="/redoc",
+    )
+
+    # Conditional-GET revalidation for polled dashboard endpoints
+    app.add_middleware(ConditionalGetMiddleware)
+
+    # Compress large aggregate payloads (heatmap, timeseries) - runs
+    # after the ETag check so hashes cover the uncompressed body
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+    # CORS middleware - explicit stable origins plus a compiled regex
+    # that covers Vercel preview deployments
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=list(settings.CORS_ORIGINS),
+        allow_origin_regex=settings.CORS_ORIGIN_REGEX,
+        allow_credentials=False,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+    @app.get("/health/live")
+    async def health_live():
+        """Liveness probe - always 200 once the process is up"""
+        return {"status": "alive"}
+
+    @app.get("/health/ready")
+    async def health_ready():
+        """Readiness probe - 503 until deferred init completes"""
+        if not getattr(app.state, "ready", False):
+            return JSONResponse(
+                status_code=503,
+                content={"status": "initializing"},
+            )
+        return {"status": "ready"}
+
+    return app
+
+
+app = create_app()
+
+# Static response skeletons - built once so the hot probe/root paths only
+# splice in an epoch timestamp instead of rebuilding nested dicts.
+_ROOT_RESPONSE = {
+    "name": "Aadhaar Pulse API",
+    "version": settings.API_VERSION,
+    "description": "Government-Grade Decision Support Analytics Platform",
+    "status": "operational",
+    "endpoints": {
+        "overview": "/api/v1/overview",
+        "enrolments": "/api/v1/enrolments",
+        "updates": "/api/v1/updates",
+        "anomalies": "/api/v1/anomalies",
+        "forecasts": "/api/v1/forecasts",
+        "insights": "/api/v1/insights",
+        "recommendations": "/api/v1/recommendations",
+        "geography": "/api/v1/geography",
+    },
+    "docs": "/docs",
+}
+
+_HEALTH_RESPONSE = {
+    "status": "healthy",
+    "services": {
+        "data_repository": "operational",
+        "analytics": "operational",
+        "anomaly_detection": "operational",
+        "forecasting": "operational",
+        "insights": "operational",
+    },
+}
 
 
 @app.get("/")
 async def root():
     """API root endpoint"""
-    return {
-        "name": "Aadhaar Pulse API",
-        "version": settings.API_VERSION,
-        "description": "Government-Grade Decision Support Analytics Platform",
-        "status": "operational",
-        "timestamp": datetime.now().isoformat(),
-        "endpoints": {
-            "overview": "/api/v1/overview",
-            "enrolments": "/api/v1/enrolments",
-            "updates": "/api/v1/updates",
-            "anomalies": "/api/v1/anomalies",
-            "forecasts": "/api/v1/forecasts",
-            "insights": "/api/v1/insights",
-            "recommendations": "/api/v1/recommendations",
-            "geography": "/api/v1/geography",
-        },
-        "docs": "/docs",
-    }
+    return {**_ROOT_RESPONSE, "timestamp": time.time()}
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "services": {
-            "data_repository": "operational",
-            "analytics": "operational",
-            "anomaly_detection": "operational",
-            "forecasting": "operational",
-            "insights": "operational",
-        },
-    }
+    return {**_HEALTH_RESPONSE, "timestamp": time.time()}
+
+
+# Pre-serialized /api/v1/metadata skeleton - the static head and privacy
+# tail are encoded once; per request only the two dynamic blocks are
+# serialized and byte-spliced in.
+_METADATA_HEAD = orjson.dumps({"api_version": settings.API_VERSION})[:-1]
+_METADATA_TAIL = b',"privacy":' + orjson.dumps({
+    "pii_free": True,
+    "aggregation_level": "State/District/Pincode",
+    "compliance": "UIDAI Guidelines",
+    "note": "All data is aggregated - no individual-level information",
+}) + b'}'
 
 
 @app.get("/api/v1/metadata")
-async def get_metadata():
+async def get_metadata(request: Request):
     """Get API metadata and data source information"""
     from services.data_repository import aadhaar_repository
-    
+
     api_info = aadhaar_repository.get_api_metadata()
     summary = aadhaar_repository.get_summary_stats()
-    
-    return {
-        "api_version": settings.API_VERSION,
-        "data_source": {
-            "type": api_info.get("data_source", "simulated"),
-            "primary": "Data.gov.in Official Aadhaar Datasets",
-            "resource_id": "ecd49b12-3084-4521-8f7e-ca8bf72069ba",
-            "total_records": api_info.get("total_records_available", 0),
-            "api_title": api_info.get("api_title"),
-            "organization": api_info.get("org"),
-            "last_updated": api_info.get("updated_date"),
-            "last_refresh": api_info.get("last_refresh"),
-        },
-        "coverage": {
-            "states": summary.get("states_covered", 36),
-            "total_enrolments": summary.get("total_enrolments", 0),
-            "time_range": "2020-2025",
-            "update_frequency": "Monthly",
-        },
-        "privacy": {
-            "pii_free": True,
-            "aggregation_level": "State/District/Pincode",
-            "compliance": "UIDAI Guidelines",
-            "note": "All data is aggregated - no individual-level information",
-        },
-    }
 
+    data_source = orjson.dumps({
+        "type": api_info.get("data_source", "simulated"),
+        "primary": "Data.gov.in Official Aadhaar Datasets",
+        "resource_id": "ecd49b12-3084-4521-8f7e-ca8bf72069ba",
+        "total_records": api_info.get("total_records_available", 0),
+        "api_title": api_info.get("api_title"),
+        "organization": api_info.get("org"),
+        "last_updated": api_info.get("updated_date"),
+        "last_refresh": api_info.get("last_refresh"),
+    })
+    coverage = orjson.dumps({
+        "states": summary.get("states_covered", 36),
+        "total_enrolments": summary.get("total_enrolments", 0),
+        "time_range": "2020-2025",
+        "update_frequency": "Monthly",
+    })
+
+    body = (
+        _METADATA_HEAD
+        + b',"data_source":' + data_source
+        + b',"coverage":' + coverage
+        + _METADATA_TAIL
+    )
+
+    # ETag short-circuit - pollers with a current copy get a bodyless 304
+    etag = 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"max-age={settings.CACHE_TTL_SECONDS}",
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,7 +1,13 @@
 """Models package initialization"""
 from models.base import Base
-from models.enrolment import Enrolment
-from models.update import Update
+from models.enrolment import (
+    Enrolment,
+    EnrolmentFact,
+    EnrolmentDemographics,
+    EnrolmentOps,
+    EnrolmentDerived,
+)
+from models.update import Update, UpdateFact, UpdateDemographics, UpdateDerived
 from models.anomaly import Anomaly
 from models.forecast import Forecast
 from models.insight import Insight
@@ -9,7 +15,14 @@ from models.insight import Insight
 __all__ = [
     "Base",
     "Enrolment",
+    "EnrolmentFact",
+    "EnrolmentDemographics",
+    "EnrolmentOps",
+    "EnrolmentDerived",
     "Update",
+    "UpdateFact",
+    "UpdateDemographics",
+    "UpdateDerived",
     "Anomaly",
     "Forecast",
     "Insight"
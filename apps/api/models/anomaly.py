@@ -1,6 +1,24 @@
 """Anomaly data model"""
-from sqlalchemy import Column, String, Integer, Float, Date, DateTime, Text, Index
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, Text, Index, Enum
 from models.base import Base, TimestampMixin
+import enum
+
+
+class DetectionMethod(str, enum.Enum):
+    """Detection algorithms that can flag an anomaly"""
+    ISOLATION_FOREST = "isolation_forest"
+    ZSCORE = "zscore"
+    IQR = "iqr"
+    SEASONAL = "seasonal"
+    RULE_BASED = "rule_based"
+
+
+class AnomalySeverity(str, enum.Enum):
+    """Severity levels for detected anomalies"""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
 
 
 class Anomaly(Base, TimestampMixin):
@@ -14,7 +32,10 @@ class Anomaly(Base, TimestampMixin):
     
     # Detection metadata
     detected_at = Column(DateTime, nullable=False, index=True)
-    detection_method = Column(String(50), nullable=False)  # isolation_forest, zscore, iqr
+    detection_method = Column(
+        Enum(DetectionMethod, native_enum=False, length=20, validate_strings=True),
+        nullable=False,
+    )
     
     # Temporal context
     date = Column(Date, nullable=False, index=True)
@@ -32,7 +53,10 @@ class Anomaly(Base, TimestampMixin):
     data_source = Column(String(50), nullable=False)  # enrolments, updates
     
     # Severity and scores
-    severity = Column(String(20), nullable=False)  # low, medium, high, critical
+    severity = Column(
+        Enum(AnomalySeverity, native_enum=False, length=10, validate_strings=True),
+        nullable=False,
+    )
     anomaly_score = Column(Float, nullable=False)  # 0-1 or z-score
     confidence = Column(Float, nullable=False, default=0.5)  # 0-1
     
@@ -59,6 +83,9 @@ class Anomaly(Base, TimestampMixin):
         Index('ix_anomalies_date_state', 'date', 'state_code'),
         Index('ix_anomalies_type_severity', 'anomaly_type', 'severity'),
     )
-    
+    __mapper_args__ = {"eager_defaults": True}
+
+    _REPR_FMT = "<Anomaly(date={d}, type={t}, severity={s})>"
+
     def __repr__(self):
-        return f"<Anomaly(date={self.date}, type={self.anomaly_type}, severity={self.severity})>"
+        return self._REPR_FMT.format(d=self.date, t=self.anomaly_type, s=self.severity)
@@ -1,12 +1,117 @@
 """Enrolment data model"""
-from sqlalchemy import Column, String, Integer, Float, Date, Boolean, Index
+from sqlalchemy import Column, String, Integer, Float, Date, Boolean, Index, ForeignKeyConstraint
+from sqlalchemy.orm import relationship
 from models.base import Base, TimestampMixin
 
 
+# Shared composite key for the narrow fact table and its SoA sidecars.
+# Analytics scans that only need totals by state read the narrow fact
+# rows instead of the full wide tuple.
+_FACT_KEY = ("date", "state_code", "district_code")
+
+
+class EnrolmentFact(Base, TimestampMixin):
+    """
+    Narrow enrolment fact table.
+    Holds only the columns hot analytics scans actually read;
+    demographics, operational and derived columns live in sidecar
+    tables sharing the same composite key (SoA split).
+    """
+    __tablename__ = "enrolment_facts"
+
+    date = Column(Date, primary_key=True)
+    state_code = Column(String(3), primary_key=True)
+    district_code = Column(String(10), primary_key=True, default="")
+
+    state_name = Column(String(100), nullable=False)
+    region = Column(String(50), nullable=True)
+
+    total_enrolments = Column(Integer, nullable=False, default=0)
+    new_enrolments = Column(Integer, nullable=False, default=0)
+
+    demographics = relationship("EnrolmentDemographics", uselist=False, viewonly=True)
+    ops = relationship("EnrolmentOps", uselist=False, viewonly=True)
+    derived = relationship("EnrolmentDerived", uselist=False, viewonly=True)
+
+    __table_args__ = (
+        Index('ix_enrolment_facts_state_date', 'state_code', 'date'),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    _REPR_FMT = "<EnrolmentFact(date={d}, state={s}, total={t})>"
+
+    def __repr__(self):
+        return self._REPR_FMT.format(d=self.date, s=self.state_code, t=self.total_enrolments)
+
+
+class EnrolmentDemographics(Base):
+    """Demographic counters sidecar for EnrolmentFact"""
+    __tablename__ = "enrolment_demographics"
+
+    date = Column(Date, primary_key=True)
+    state_code = Column(String(3), primary_key=True)
+    district_code = Column(String(10), primary_key=True, default="")
+
+    male_count = Column(Integer, default=0)
+    female_count = Column(Integer, default=0)
+    other_gender_count = Column(Integer, default=0)
+
+    age_0_5 = Column(Integer, default=0)
+    age_5_18 = Column(Integer, default=0)
+    age_18_40 = Column(Integer, default=0)
+    age_40_60 = Column(Integer, default=0)
+    age_60_plus = Column(Integer, default=0)
+
+    urban_count = Column(Integer, default=0)
+    rural_count = Column(Integer, default=0)
+
+    __table_args__ = (
+        ForeignKeyConstraint(_FACT_KEY, [f"enrolment_facts.{c}" for c in _FACT_KEY]),
+    )
+
+
+class EnrolmentOps(Base):
+    """Operational metrics sidecar for EnrolmentFact"""
+    __tablename__ = "enrolment_ops"
+
+    date = Column(Date, primary_key=True)
+    state_code = Column(String(3), primary_key=True)
+    district_code = Column(String(10), primary_key=True, default="")
+
+    registrar_count = Column(Integer, default=0)
+    enrolment_agency_count = Column(Integer, default=0)
+    average_processing_time = Column(Float, default=0)  # in minutes
+
+    is_metro = Column(Boolean, default=False)
+    is_border_district = Column(Boolean, default=False)
+
+    __table_args__ = (
+        ForeignKeyConstraint(_FACT_KEY, [f"enrolment_facts.{c}" for c in _FACT_KEY]),
+    )
+
+
+class EnrolmentDerived(Base):
+    """Derived analytics metrics sidecar for EnrolmentFact"""
+    __tablename__ = "enrolment_derived"
+
+    date = Column(Date, primary_key=True)
+    state_code = Column(String(3), primary_key=True)
+    district_code = Column(String(10), primary_key=True, default="")
+
+    growth_rate = Column(Float, nullable=True)  # month-over-month
+    per_capita_rate = Column(Float, nullable=True)  # per 1000 population
+    saturation_index = Column(Float, nullable=True)  # 0-1 scale
+
+    __table_args__ = (
+        ForeignKeyConstraint(_FACT_KEY, [f"enrolment_facts.{c}" for c in _FACT_KEY]),
+    )
+
+
 class Enrolment(Base, TimestampMixin):
     """
-    Aadhaar Enrolment data model
-    Stores aggregated enrolment statistics by date, state, and district
+    Aadhaar Enrolment data model (legacy wide row)
+    Stores aggregated enrolment statistics by date, state, and district.
+    New analytics paths should prefer EnrolmentFact + sidecars.
     """
     __tablename__ = "enrolments"
     
@@ -63,6 +168,9 @@ class Enrolment(Base, TimestampMixin):
         Index('ix_enrolments_date_district', 'date', 'district_code'),
         Index('ix_enrolments_year_month', 'year', 'month'),
     )
-    
+    __mapper_args__ = {"eager_defaults": True}
+
+    _REPR_FMT = "<Enrolment(date={d}, state={s}, total={t})>"
+
     def __repr__(self):
-        return f"<Enrolment(date={self.date}, state={self.state_name}, total={self.total_enrolments})>"
+        return self._REPR_FMT.format(d=self.date, s=self.state_name, t=self.total_enrolments)
@@ -53,5 +53,9 @@ class Forecast(Base, TimestampMixin):
         Index('ix_forecasts_state_metric', 'state_code', 'metric_type'),
     )
     
+    __mapper_args__ = {"eager_defaults": True}
+
+    _REPR_FMT = "<Forecast(date={d}, metric={m}, value={v})>"
+
     def __repr__(self):
-        return f"<Forecast(date={self.forecast_date}, metric={self.metric_type}, value={self.predicted_value})>"
+        return self._REPR_FMT.format(d=self.forecast_date, m=self.metric_type, v=self.predicted_value)
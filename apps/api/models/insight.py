@@ -64,5 +64,9 @@ class Insight(Base, TimestampMixin):
         Index('ix_insights_scope_date', 'scope', 'period_start'),
     )
     
+    __mapper_args__ = {"eager_defaults": True}
+
+    _REPR_FMT = "<Insight(category={c}, title={t}...)>"
+
     def __repr__(self):
-        return f"<Insight(category={self.category}, title={self.title[:30]}...)>"
+        return self._REPR_FMT.format(c=self.category, t=self.title[:30])
@@ -1,8 +1,12 @@
 """Update data model"""
-from sqlalchemy import Column, String, Integer, Float, Date, Index, Enum
+from sqlalchemy import Column, String, Integer, Float, Date, Index, Enum, ForeignKeyConstraint
+from sqlalchemy.orm import relationship
 from models.base import Base, TimestampMixin
 import enum
 
+# Shared composite key for the narrow fact table and its SoA sidecars
+_FACT_KEY = ("date", "state_code", "district_code", "update_type")
+
 
 class UpdateType(str, enum.Enum):
     """Types of Aadhaar updates"""
@@ -19,10 +23,95 @@ class UpdateType(str, enum.Enum):
     FINGERPRINT = "fingerprint"
 
 
+class UpdateFact(Base, TimestampMixin):
+    """
+    Narrow update fact table.
+    Hot analytics scans (totals by type/state/month) read this table;
+    demographic and derived columns live in sidecar tables sharing the
+    same composite key (SoA split).
+    """
+    __tablename__ = "update_facts"
+
+    date = Column(Date, primary_key=True)
+    state_code = Column(String(3), primary_key=True)
+    district_code = Column(String(10), primary_key=True, default="")
+    update_type = Column(
+        Enum(UpdateType, native_enum=False, length=20, validate_strings=True),
+        primary_key=True,
+    )
+
+    state_name = Column(String(100), nullable=False)
+    total_updates = Column(Integer, nullable=False, default=0)
+    online_updates = Column(Integer, default=0)
+    offline_updates = Column(Integer, default=0)
+
+    demographics = relationship("UpdateDemographics", uselist=False, viewonly=True)
+    derived = relationship("UpdateDerived", uselist=False, viewonly=True)
+
+    __table_args__ = (
+        Index('ix_update_facts_type_date', 'update_type', 'date'),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    _REPR_FMT = "<UpdateFact(date={d}, type={t}, total={n})>"
+
+    def __repr__(self):
+        return self._REPR_FMT.format(d=self.date, t=self.update_type, n=self.total_updates)
+
+
+class UpdateDemographics(Base):
+    """Demographic counters sidecar for UpdateFact"""
+    __tablename__ = "update_demographics"
+
+    date = Column(Date, primary_key=True)
+    state_code = Column(String(3), primary_key=True)
+    district_code = Column(String(10), primary_key=True, default="")
+    update_type = Column(String(20), primary_key=True)
+
+    male_count = Column(Integer, default=0)
+    female_count = Column(Integer, default=0)
+
+    age_0_18 = Column(Integer, default=0)
+    age_18_40 = Column(Integer, default=0)
+    age_40_60 = Column(Integer, default=0)
+    age_60_plus = Column(Integer, default=0)
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            _FACT_KEY, [f"update_facts.{c}" for c in _FACT_KEY]
+        ),
+    )
+
+
+class UpdateDerived(Base):
+    """Derived metrics sidecar for UpdateFact"""
+    __tablename__ = "update_derived"
+
+    date = Column(Date, primary_key=True)
+    state_code = Column(String(3), primary_key=True)
+    district_code = Column(String(10), primary_key=True, default="")
+    update_type = Column(String(20), primary_key=True)
+
+    first_time_updates = Column(Integer, default=0)
+    repeat_updates = Column(Integer, default=0)
+    average_update_interval_days = Column(Float, nullable=True)
+
+    update_rate = Column(Float, nullable=True)  # updates per 1000 enrolled
+    growth_rate = Column(Float, nullable=True)  # month-over-month
+    fatigue_index = Column(Float, nullable=True)  # high repeat rate indicator
+
+    __table_args__ = (
+        ForeignKeyConstraint(
+            _FACT_KEY, [f"update_facts.{c}" for c in _FACT_KEY]
+        ),
+    )
+
+
 class Update(Base, TimestampMixin):
     """
-    Aadhaar Update data model
-    Tracks update requests and patterns by type, location, and time
+    Aadhaar Update data model (legacy wide row)
+    Tracks update requests and patterns by type, location, and time.
+    New analytics paths should prefer UpdateFact + sidecars.
     """
     __tablename__ = "updates"
     
@@ -40,8 +129,13 @@ class Update(Base, TimestampMixin):
     district_code = Column(String(10), nullable=True, index=True)
     district_name = Column(String(100), nullable=True)
     
-    # Update type breakdown
-    update_type = Column(String(50), nullable=False, index=True)
+    # Update type breakdown - compact varchar(20) validated at insert,
+    # keeps the ix_updates_type_date composite index narrow
+    update_type = Column(
+        Enum(UpdateType, native_enum=False, length=20, validate_strings=True),
+        nullable=False,
+        index=True,
+    )
     total_updates = Column(Integer, nullable=False, default=0)
     
     # Online vs Offline
@@ -74,6 +168,9 @@ class Update(Base, TimestampMixin):
         Index('ix_updates_type_date', 'update_type', 'date'),
         Index('ix_updates_year_month', 'year', 'month'),
     )
-    
+    __mapper_args__ = {"eager_defaults": True}
+
+    _REPR_FMT = "<Update(date={d}, type={t}, total={n})>"
+
     def __repr__(self):
-        return f"<Update(date={self.date}, type={self.update_type}, total={self.total_updates})>"
+        return self._REPR_FMT.format(d=self.date, t=self.update_type, n=self.total_updates)
@@ -0,0 +1,9 @@
+"""
+Shared Router Helpers
+Small dependencies used by more than one router
+"""
+
+
+def norm_code(state_code: str) -> str:
+    """Normalize the state-code path parameter once, at the request boundary"""
+    return state_code.upper()
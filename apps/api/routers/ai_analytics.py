@@ -2,18 +2,38 @@
 AI Analytics Router
 Gemini-powered advanced analysis endpoints
 """
-from fastapi import APIRouter, Query, HTTPException
+import asyncio
+import hashlib
+
+import orjson
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
 from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from services.gemini_service import gemini_service
 from services.analytics_service import analytics_service
 from services.anomaly_engine import anomaly_engine
 from services.forecast_engine import forecasting_engine
 from services.data_repository import aadhaar_repository
+from services.ttl_cache import ai_response_cache
+from config import settings
 
 router = APIRouter(prefix="/ai", tags=["AI Analytics"])
 
 
+def _cached_analysis(endpoint: str, data: Dict[str, Any], analysis_type: str) -> Dict[str, Any]:
+    """Serve Gemini analysis from the TTL cache when the inputs are unchanged"""
+    key = ai_response_cache.make_key(endpoint, data)
+    cached = ai_response_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = gemini_service.analyze_data_sync(data, analysis_type)
+    if not result.get("error"):
+        ai_response_cache.put(key, result)
+    return result
+
+
 class ChatRequest(BaseModel):
     question: str
 
@@ -23,10 +43,24 @@ class AnalysisRequest(BaseModel):
     analysis_type: str = "general"
 
 
+# Precompiled validator - decoding the raw body through a TypeAdapter
+# skips FastAPI's per-request field introspection on the hot chat path.
+_chat_adapter = TypeAdapter(ChatRequest)
+
+
+async def decode_chat(request: Request) -> ChatRequest:
+    try:
+        return _chat_adapter.validate_json(await request.body())
+    except ValidationError as exc:
+        # Surface malformed bodies as FastAPI's native 422, matching
+        # what a BaseModel-annotated body parameter would return
+        raise RequestValidationError(exc.errors()) from exc
+
+
 @router.get("/status")
-async def get_ai_status() -> Dict[str, Any]:
+async def get_ai_status(request: Request) -> Response:
     """Check AI service status"""
-    return {
+    body = orjson.dumps({
         "gemini_available": gemini_service.is_available(),
         "model": "gemini-2.5-flash-preview-05-20",
         "capabilities": [
@@ -37,7 +71,15 @@ async def get_ai_status() -> Dict[str, Any]:
             "forecast_analysis",
             "recommendation_generation",
         ],
-    }
+        "cache": ai_response_cache.stats(),
+    })
+
+    # ETag short-circuit - pollers with a current copy get a bodyless 304
+    etag = 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": f"max-age={settings.CACHE_TTL_SECONDS}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/executive-summary")
@@ -47,70 +89,75 @@ async def get_executive_summary() -> Dict[str, Any]:
     Uses Gemini 2.5 Flash to analyze all key metrics and provide
     actionable insights for leadership.
     """
-    # Gather all relevant data
-    overview = analytics_service.get_overview_metrics()
-    anomalies = anomaly_engine.detect_all_anomalies()
-    forecast = forecasting_engine.generate_forecast("enrolments")
-    
-    # Generate AI summary
-    summary = gemini_service.generate_executive_summary(
-        overview_data=overview,
-        anomalies=anomalies,
-        forecasts=forecast
+    # Gather all relevant data (independent, so overlap the calls)
+    overview, anomalies, forecast = await asyncio.gather(
+        asyncio.to_thread(analytics_service.get_overview_metrics),
+        asyncio.to_thread(anomaly_engine.detect_all_anomalies),
+        asyncio.to_thread(forecasting_engine.generate_forecast, "enrolments"),
+    )
+
+    # Generate AI summary (network call - keep it off the event loop)
+    return await asyncio.to_thread(
+        gemini_service.generate_executive_summary, overview, anomalies, forecast
     )
-    
-    return summary
 
 
 @router.get("/analyze/overview")
 async def analyze_overview() -> Dict[str, Any]:
     """AI analysis of dashboard overview data"""
-    overview = analytics_service.get_overview_metrics()
-    return gemini_service.analyze_data_sync(overview, "overview")
+    overview = await asyncio.to_thread(analytics_service.get_overview_metrics)
+    return await asyncio.to_thread(_cached_analysis, "analyze_overview", overview, "overview")
 
 
 @router.get("/analyze/anomalies")
 async def analyze_anomalies() -> Dict[str, Any]:
     """AI analysis and explanation of detected anomalies"""
-    anomalies = anomaly_engine.detect_all_anomalies()
-    return gemini_service.analyze_data_sync({"anomalies": anomalies}, "anomaly")
+    anomalies = await asyncio.to_thread(anomaly_engine.detect_all_anomalies)
+    return await asyncio.to_thread(
+        _cached_analysis, "analyze_anomalies", {"anomalies": anomalies}, "anomaly"
+    )
 
 
 @router.get("/analyze/forecast")
 async def analyze_forecast() -> Dict[str, Any]:
     """AI analysis of forecast data with strategic recommendations"""
-    forecast = forecasting_engine.generate_forecast("enrolments")
-    capacity = forecasting_engine.get_capacity_forecast()
-    return gemini_service.analyze_data_sync(
-        {"forecast": forecast, "capacity": capacity}, 
-        "forecast"
+    forecast, capacity = await asyncio.gather(
+        asyncio.to_thread(forecasting_engine.generate_forecast, "enrolments"),
+        asyncio.to_thread(forecasting_engine.get_capacity_forecast),
+    )
+    return await asyncio.to_thread(
+        _cached_analysis,
+        "analyze_forecast",
+        {"forecast": forecast, "capacity": capacity},
+        "forecast",
     )
 
 
 @router.get("/analyze/geography")
 async def analyze_geography() -> Dict[str, Any]:
     """AI analysis of geographic distribution"""
-    geo_data = analytics_service.get_geography_data()
-    return gemini_service.analyze_data_sync(geo_data, "geographic")
+    geo_data = await asyncio.to_thread(analytics_service.get_geography_data)
+    return await asyncio.to_thread(_cached_analysis, "analyze_geography", geo_data, "geographic")
 
 
 @router.get("/analyze/demographics")
 async def analyze_demographics() -> Dict[str, Any]:
     """AI analysis of demographic patterns"""
-    demo_data = aadhaar_repository.get_demographics()
-    return gemini_service.analyze_data_sync(demo_data, "demographic")
+    demo_data = await asyncio.to_thread(aadhaar_repository.get_demographics)
+    return await asyncio.to_thread(
+        _cached_analysis, "analyze_demographics", demo_data, "demographic"
+    )
 
 
 @router.get("/explain/anomaly/{anomaly_id}")
 async def explain_anomaly(anomaly_id: str) -> Dict[str, Any]:
     """Get AI-powered explanation for a specific anomaly"""
-    anomalies = anomaly_engine.detect_all_anomalies()
-    anomaly = next((a for a in anomalies if a["id"] == anomaly_id), None)
-    
+    anomaly = await asyncio.to_thread(anomaly_engine.get_anomaly_by_id, anomaly_id)
+
     if not anomaly:
         raise HTTPException(status_code=404, detail=f"Anomaly {anomaly_id} not found")
     
-    return gemini_service.explain_anomaly(anomaly)
+    return await asyncio.to_thread(gemini_service.explain_anomaly, anomaly)
 
 
 @router.get("/insight/smart")
@@ -119,8 +166,8 @@ async def get_smart_insight(
 ) -> Dict[str, Any]:
     """Get an AI-generated smart insight based on current data"""
     # Gather relevant data based on context
-    overview = analytics_service.get_overview_metrics()
-    
+    overview = await asyncio.to_thread(analytics_service.get_overview_metrics)
+
     data = {
         "summary": overview["summary"],
         "trends": overview["trends"],
@@ -128,20 +175,23 @@ async def get_smart_insight(
         "alerts": overview["alerts"],
     }
     
-    return gemini_service.generate_smart_insight(data, context)
+    return await asyncio.to_thread(gemini_service.generate_smart_insight, data, context)
 
 
 @router.post("/chat")
-async def chat_with_data(request: ChatRequest) -> Dict[str, Any]:
+async def chat_with_data(request: ChatRequest = Depends(decode_chat)) -> Dict[str, Any]:
     """
     Ask natural language questions about Aadhaar data.
     The AI will answer based on the current dashboard data.
     """
-    # Build data context
-    overview = analytics_service.get_overview_metrics()
-    states = aadhaar_repository.get_state_data()[:10]
-    demographics = aadhaar_repository.get_demographics()
-    
+    # Build data context (independent lookups run concurrently)
+    overview, states, demographics = await asyncio.gather(
+        asyncio.to_thread(analytics_service.get_overview_metrics),
+        asyncio.to_thread(aadhaar_repository.get_state_data),
+        asyncio.to_thread(aadhaar_repository.get_demographics),
+    )
+    states = states[:10]
+
     context = {
         "overview": overview["summary"],
         "trends": overview["trends"],
@@ -150,18 +200,20 @@ async def chat_with_data(request: ChatRequest) -> Dict[str, Any]:
         "data_source": aadhaar_repository.get_api_metadata(),
     }
     
-    return gemini_service.chat_with_data(request.question, context)
+    return await asyncio.to_thread(gemini_service.chat_with_data, request.question, context)
 
 
 @router.get("/recommendations/smart")
 async def get_smart_recommendations() -> Dict[str, Any]:
     """Get AI-powered policy recommendations"""
-    # Gather comprehensive data
-    overview = analytics_service.get_overview_metrics()
-    update_analytics = analytics_service.get_update_analytics()
-    states = aadhaar_repository.get_state_data()
-    anomalies = anomaly_engine.detect_all_anomalies()
-    
+    # Gather comprehensive data (independent, so overlap the calls)
+    overview, update_analytics, states, anomalies = await asyncio.gather(
+        asyncio.to_thread(analytics_service.get_overview_metrics),
+        asyncio.to_thread(analytics_service.get_update_analytics),
+        asyncio.to_thread(aadhaar_repository.get_state_data),
+        asyncio.to_thread(anomaly_engine.detect_all_anomalies),
+    )
+
     data = {
         "overview": overview,
         "update_patterns": update_analytics["update_fatigue_index"],
@@ -169,7 +221,7 @@ async def get_smart_recommendations() -> Dict[str, Any]:
         "active_anomalies": anomalies[:5],
     }
     
-    return gemini_service.analyze_data_sync(data, "recommendation")
+    return await asyncio.to_thread(_cached_analysis, "recommendations_smart", data, "recommendation")
 
 
 @router.get("/report/daily")
@@ -178,21 +230,29 @@ async def generate_daily_report() -> Dict[str, Any]:
     if not gemini_service.is_available():
         return {"error": "AI service unavailable", "ai_powered": False}
     
-    # Gather all data
-    overview = analytics_service.get_overview_metrics()
-    anomalies = anomaly_engine.detect_all_anomalies()
-    forecast = forecasting_engine.generate_forecast("enrolments")
-    geo = analytics_service.get_geography_data()
-    
-    # Generate executive summary
-    exec_summary = gemini_service.generate_executive_summary(overview, anomalies, forecast)
-    
-    # Analyze overview
-    overview_analysis = gemini_service.analyze_data_sync(overview, "overview")
-    
-    # Analyze anomalies
-    anomaly_analysis = gemini_service.analyze_data_sync({"anomalies": anomalies[:5]}, "anomaly")
-    
+    # Gather all data (independent, so overlap the calls)
+    overview, anomalies, forecast, geo = await asyncio.gather(
+        asyncio.to_thread(analytics_service.get_overview_metrics),
+        asyncio.to_thread(anomaly_engine.detect_all_anomalies),
+        asyncio.to_thread(forecasting_engine.generate_forecast, "enrolments"),
+        asyncio.to_thread(analytics_service.get_geography_data),
+    )
+
+    # Two Gemini round-trips instead of three: the overview and anomaly
+    # analyses share one batched call, overlapped with the summary
+    exec_summary, analyses = await asyncio.gather(
+        asyncio.to_thread(gemini_service.generate_executive_summary, overview, anomalies, forecast),
+        asyncio.to_thread(
+            gemini_service.analyze_batch,
+            [
+                ("overview", overview, "overview"),
+                ("anomalies", {"anomalies": anomalies[:5]}, "anomaly"),
+            ],
+        ),
+    )
+    overview_analysis = analyses.get("overview", {})
+    anomaly_analysis = analyses.get("anomalies", {})
+
     return {
         "report_date": overview["metadata"]["computed_at"],
         "executive_summary": exec_summary.get("executive_summary", ""),
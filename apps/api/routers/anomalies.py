@@ -2,14 +2,57 @@
 Anomalies Router
 Anomaly detection and explanation endpoints
 """
+import asyncio
+import time
+from collections import Counter
 from fastapi import APIRouter, Query
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from services.anomaly_engine import anomaly_engine
 
 router = APIRouter(prefix="/anomalies", tags=["Anomalies"])
 
+# Detection snapshot shared by every endpoint - detection is the dominant
+# cost on dashboard polling paths, so repeat requests within the TTL are
+# served from memory, and detail/explain lookups hit an id index instead
+# of scanning the list.
+_ANOMALY_TTL_SECONDS = 30
+_SEVERITY_ZEROS = {"high": 0, "medium": 0, "low": 0, "critical": 0}
+_anomalies: Optional[List[Dict[str, Any]]] = None
+_anomalies_by_id: Dict[str, Dict[str, Any]] = {}
+_anomalies_by_severity: Dict[str, int] = dict(_SEVERITY_ZEROS)
+_anomalies_time: float = 0.0
+_anomalies_lock = asyncio.Lock()
 
-@router.get("")
+
+async def _get_anomalies() -> List[Dict[str, Any]]:
+    """Detection snapshot, refreshed off the event loop at most once per TTL"""
+    global _anomalies, _anomalies_by_id, _anomalies_by_severity, _anomalies_time
+    now = time.monotonic()
+    if _anomalies is not None and now - _anomalies_time <= _ANOMALY_TTL_SECONDS:
+        return _anomalies
+
+    async with _anomalies_lock:
+        # Double-check: another request may have refreshed while we waited
+        now = time.monotonic()
+        if _anomalies is None or now - _anomalies_time > _ANOMALY_TTL_SECONDS:
+            anomalies = await asyncio.to_thread(anomaly_engine.detect_all_anomalies)
+            _anomalies = anomalies
+            _anomalies_by_id = {a["id"]: a for a in anomalies}
+            _anomalies_by_severity = {
+                **_SEVERITY_ZEROS,
+                **Counter(a["severity"] for a in anomalies),
+            }
+            _anomalies_time = time.monotonic()
+    return _anomalies
+
+
+async def _get_anomaly(anomaly_id: str) -> Optional[Dict[str, Any]]:
+    """O(1) id lookup against the cached detection snapshot"""
+    await _get_anomalies()
+    return _anomalies_by_id.get(anomaly_id)
+
+
+@router.get("", response_model=None)
 async def get_anomalies(
     severity: Optional[str] = Query(default=None, description="Filter by severity: high, medium, low"),
     type: Optional[str] = Query(default=None, description="Filter by anomaly type")
@@ -21,19 +64,25 @@ async def get_anomalies(
         - List of anomalies with severity, type, and recommendations
         - Summary statistics
     """
-    anomalies = anomaly_engine.detect_all_anomalies()
-    
-    # Apply filters
-    if severity:
-        anomalies = [a for a in anomalies if a["severity"] == severity]
-    if type:
-        anomalies = [a for a in anomalies if a["type"] == type]
-    
-    # Count by severity
-    by_severity = {"high": 0, "medium": 0, "low": 0, "critical": 0}
-    for a in anomalies:
-        by_severity[a["severity"]] = by_severity.get(a["severity"], 0) + 1
-    
+    anomalies = await _get_anomalies()
+
+    # Unfiltered requests reuse the histogram computed at cache refresh
+    if not severity and not type:
+        by_severity = _anomalies_by_severity
+    else:
+        if severity:
+            anomalies = [a for a in anomalies if a["severity"] == severity]
+        if type:
+            anomalies = [a for a in anomalies if a["type"] == type]
+        if severity and not type:
+            # Only one bucket can be non-empty - no counting pass needed
+            by_severity = {**_SEVERITY_ZEROS, severity: len(anomalies)}
+        else:
+            by_severity = {
+                **_SEVERITY_ZEROS,
+                **Counter(a["severity"] for a in anomalies),
+            }
+
     return {
         "anomalies": anomalies,
         "total_anomalies": len(anomalies),
@@ -41,18 +90,24 @@ async def get_anomalies(
     }
 
 
+@router.post("/batch")
+async def get_anomalies_batch(ids: List[str]) -> Dict[str, Any]:
+    """Resolve many anomaly ids in one round-trip"""
+    await _get_anomalies()
+    return {"anomalies": {i: _anomalies_by_id.get(i) for i in ids}}
+
+
 @router.get("/summary")
 async def get_anomaly_summary() -> Dict[str, Any]:
     """Get anomaly detection summary statistics"""
-    return anomaly_engine.get_anomaly_summary()
+    return await asyncio.to_thread(anomaly_engine.get_anomaly_summary)
 
 
 @router.get("/{anomaly_id}")
 async def get_anomaly_detail(anomaly_id: str) -> Dict[str, Any]:
     """Get detailed information about a specific anomaly"""
-    anomalies = anomaly_engine.detect_all_anomalies()
-    anomaly = next((a for a in anomalies if a["id"] == anomaly_id), None)
-    
+    anomaly = await _get_anomaly(anomaly_id)
+
     if not anomaly:
         return {"error": f"Anomaly {anomaly_id} not found"}
     
@@ -62,9 +117,8 @@ async def get_anomaly_detail(anomaly_id: str) -> Dict[str, Any]:
 @router.get("/explain/{anomaly_id}")
 async def explain_anomaly(anomaly_id: str) -> Dict[str, Any]:
     """Get detailed explanation for an anomaly"""
-    anomalies = anomaly_engine.detect_all_anomalies()
-    anomaly = next((a for a in anomalies if a["id"] == anomaly_id), None)
-    
+    anomaly = await _get_anomaly(anomaly_id)
+
     if not anomaly:
         return {"error": f"Anomaly {anomaly_id} not found"}
     
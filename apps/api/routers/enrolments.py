@@ -2,15 +2,17 @@
 Enrolments Router
 Enrolment analytics and time series data
 """
-from fastapi import APIRouter, Query
+import asyncio
+from fastapi import APIRouter, Depends, Query
 from typing import Dict, Any, Optional
+from routers._shared import norm_code
 from services.analytics_service import analytics_service
 from services.data_repository import aadhaar_repository
 
 router = APIRouter(prefix="/enrolments", tags=["Enrolments"])
 
 
-@router.get("")
+@router.get("", response_model=None)
 async def get_enrolments(
     months: int = Query(default=24, ge=6, le=60, description="Number of months of data")
 ) -> Dict[str, Any]:
@@ -23,15 +25,15 @@ async def get_enrolments(
         - State-wise breakdown
         - Demographic distribution
     """
-    return analytics_service.get_enrolment_analytics()
+    return await analytics_service.aget_enrolment_analytics()
 
 
-@router.get("/timeseries")
+@router.get("/timeseries", response_model=None)
 async def get_timeseries(
     months: int = Query(default=24, ge=6, le=60)
 ) -> Dict[str, Any]:
     """Get enrolment time series data"""
-    data = aadhaar_repository.get_enrolment_timeseries(months=months)
+    data = await asyncio.to_thread(aadhaar_repository.get_enrolment_timeseries, months)
     return {
         "series": data,
         "count": len(data),
@@ -62,16 +64,15 @@ async def get_states() -> Dict[str, Any]:
 @router.get("/demographics")
 async def get_demographics() -> Dict[str, Any]:
     """Get demographic distribution of enrolments"""
-    analytics = analytics_service.get_enrolment_analytics()
+    analytics = (await analytics_service.aget_enrolment_analytics())
     return analytics["demographics"]
 
 
 @router.get("/state/{state_code}")
-async def get_state_details(state_code: str) -> Dict[str, Any]:
+async def get_state_details(state_code: str = Depends(norm_code)) -> Dict[str, Any]:
     """Get detailed data for a specific state"""
-    states = aadhaar_repository.get_state_data()
-    state = next((s for s in states if s["code"].upper() == state_code.upper()), None)
-    
+    state = aadhaar_repository.get_states_by_code().get(state_code)
+
     if not state:
         return {"error": f"State {state_code} not found"}
     
@@ -2,6 +2,7 @@
 Forecasts Router
 Time series forecasting and capacity planning
 """
+import asyncio
 from fastapi import APIRouter, Query
 from typing import Dict, Any
 from services.forecast_engine import forecasting_engine
@@ -9,7 +10,7 @@ from services.forecast_engine import forecasting_engine
 router = APIRouter(prefix="/forecasts", tags=["Forecasts"])
 
 
-@router.get("")
+@router.get("", response_model=None)
 async def get_forecasts(
     metric: str = Query(default="enrolments", description="Metric to forecast: enrolments or updates")
 ) -> Dict[str, Any]:
@@ -21,22 +22,22 @@ async def get_forecasts(
         - Forecast data with confidence intervals
         - Model accuracy metrics
     """
-    return forecasting_engine.generate_forecast(metric=metric)
+    return await asyncio.to_thread(forecasting_engine.generate_forecast, metric)
 
 
 @router.get("/enrolments")
 async def get_enrolment_forecast() -> Dict[str, Any]:
     """Get enrolment forecast specifically"""
-    return forecasting_engine.generate_forecast(metric="enrolments")
+    return await asyncio.to_thread(forecasting_engine.generate_forecast, "enrolments")
 
 
 @router.get("/updates")
 async def get_update_forecast() -> Dict[str, Any]:
     """Get update forecast specifically"""
-    return forecasting_engine.generate_forecast(metric="updates")
+    return await asyncio.to_thread(forecasting_engine.generate_forecast, "updates")
 
 
-@router.get("/capacity")
+@router.get("/capacity", response_model=None)
 async def get_capacity_forecast() -> Dict[str, Any]:
     """
     Get capacity planning forecast.
@@ -47,14 +48,16 @@ async def get_capacity_forecast() -> Dict[str, Any]:
         - Regional breakdown
         - Recommendations
     """
-    return forecasting_engine.get_capacity_forecast()
+    return await asyncio.to_thread(forecasting_engine.get_capacity_forecast)
 
 
 @router.get("/accuracy")
 async def get_model_accuracy() -> Dict[str, Any]:
     """Get forecast model accuracy metrics"""
-    forecast = forecasting_engine.generate_forecast(metric="enrolments")
-    return {
-        "model_info": forecast.get("model_info", {}),
-        "accuracy_metrics": forecast.get("accuracy_metrics", {}),
-    }
+    # Accessors hit the forecast cache; a cold cache still refits, so
+    # keep the call off the event loop
+    model_info, accuracy = await asyncio.gather(
+        asyncio.to_thread(forecasting_engine.get_model_info, "enrolments"),
+        asyncio.to_thread(forecasting_engine.get_accuracy_metrics, "enrolments"),
+    )
+    return {"model_info": model_info, "accuracy_metrics": accuracy}
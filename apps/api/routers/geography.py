@@ -2,15 +2,30 @@
 Geography Router
 Geographic analysis and state-wise data
 """
-from fastapi import APIRouter, Query
+import io
+from fastapi import APIRouter, Depends, Query, Request, Response
 from typing import Dict, Any, Optional
+from routers._shared import norm_code
 from services.analytics_service import analytics_service
 from services.data_repository import aadhaar_repository
+from services.ttl_cache import SingleFlight
+
+try:  # pyarrow is optional - JSON remains the default response shape
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:
+    pa = None
+
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
 
 router = APIRouter(prefix="/geography", tags=["Geography"])
 
+# Four handlers fan in to the same geography aggregate; concurrent polls
+# share one computation per 15s window.
+_geography = SingleFlight(analytics_service.get_geography_data)
+
 
-@router.get("")
+@router.get("", response_model=None)
 async def get_geography() -> Dict[str, Any]:
     """
     Get comprehensive geographic analysis.
@@ -20,22 +35,51 @@ async def get_geography() -> Dict[str, Any]:
         - State-wise breakdown
         - Regional aggregates
     """
-    return analytics_service.get_geography_data()
+    return await _geography.get()
 
 
-@router.get("/heatmap")
+@router.get("/heatmap", response_model=None)
 async def get_heatmap() -> Dict[str, Any]:
     """Get heatmap data for visualization"""
-    geo_data = analytics_service.get_geography_data()
+    geo_data = await _geography.get()
     return geo_data["heatmap"]
 
 
-@router.get("/states")
+def _states_arrow_stream(region: Optional[str]) -> bytes:
+    """Arrow IPC stream built straight from the SoA column arrays"""
+    cols = aadhaar_repository.get_state_columns()
+    columns = ["code", "name", "region", "total_enrolments", "yoy_growth", "urban_pct"]
+    arrays = [cols[c] for c in columns]
+    if region:
+        mask = cols["region"] == region.title()
+        arrays = [a[mask] for a in arrays]
+    table = pa.table(dict(zip(columns, arrays)))
+    sink = io.BytesIO()
+    with pa.ipc.RecordBatchStreamWriter(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+@router.get("/states", response_model=None)
 async def get_states(
-    region: Optional[str] = Query(default=None, description="Filter by region")
-) -> Dict[str, Any]:
-    """Get state-wise data"""
-    geo_data = analytics_service.get_geography_data()
+    request: Request,
+    response: Response,
+    region: Optional[str] = Query(default=None, description="Filter by region"),
+):
+    """Get state-wise data (JSON, or Arrow IPC via content negotiation)"""
+    # The body depends on Accept, so caches (including the conditional
+    # middleware, which keys on Accept) must not mix the two formats
+    if pa is not None and ARROW_MEDIA_TYPE in request.headers.get("accept", ""):
+        # Batch consumers (BI tools, notebooks) get the columnar form; a
+        # column copy per field beats building one dict per state
+        return Response(
+            content=_states_arrow_stream(region),
+            media_type=ARROW_MEDIA_TYPE,
+            headers={"Vary": "Accept"},
+        )
+
+    response.headers["Vary"] = "Accept"
+    geo_data = await _geography.get()
     states = geo_data["states"]
     
     if region:
@@ -50,18 +94,17 @@ async def get_states(
 @router.get("/regions")
 async def get_regions() -> Dict[str, Any]:
     """Get regional aggregates"""
-    geo_data = analytics_service.get_geography_data()
+    geo_data = await _geography.get()
     return {
         "regions": geo_data["by_region"],
     }
 
 
 @router.get("/state/{state_code}")
-async def get_state_detail(state_code: str) -> Dict[str, Any]:
+async def get_state_detail(state_code: str = Depends(norm_code)) -> Dict[str, Any]:
     """Get detailed data for a specific state"""
-    states = aadhaar_repository.get_state_data()
-    state = next((s for s in states if s["code"].upper() == state_code.upper()), None)
-    
+    state = aadhaar_repository.get_states_by_code().get(state_code)
+
     if not state:
         return {"error": f"State {state_code} not found"}
     
@@ -80,28 +123,41 @@ async def get_state_detail(state_code: str) -> Dict[str, Any]:
 
 
 @router.get("/districts/{state_code}")
-async def get_districts(state_code: str) -> Dict[str, Any]:
+async def get_districts(
+    state_code: str = Depends(norm_code),
+    top: Optional[int] = Query(default=None, ge=1, le=100, description="Return only the top-K districts"),
+) -> Dict[str, Any]:
     """Get district-wise data for a state (simulated)"""
-    states = aadhaar_repository.get_state_data()
-    state = next((s for s in states if s["code"].upper() == state_code.upper()), None)
-    
+    state = aadhaar_repository.get_states_by_code().get(state_code)
+
     if not state:
         return {"error": f"State {state_code} not found"}
     
-    # Generate sample district data
+    # Generate sample district data - single vectorized draws instead of
+    # one RNG call per district
     import numpy as np
-    num_districts = np.random.randint(10, 40)
-    
-    districts = []
-    for i in range(num_districts):
-        pct = np.random.uniform(0.01, 0.08)
-        districts.append({
+    rng = np.random.default_rng()
+    num_districts = rng.integers(10, 40)
+
+    enrolments = (state["total_enrolments"] * rng.uniform(0.01, 0.08, num_districts)).astype(np.int64)
+    growth = np.round(state["yoy_growth"] + rng.uniform(-5, 5, num_districts), 1)
+
+    if top is not None and top < num_districts:
+        # O(N) partition to the top-K, then sort only those K
+        order = np.argpartition(-enrolments, top - 1)[:top]
+        order = order[np.argsort(-enrolments[order])]
+    else:
+        order = np.argsort(-enrolments)
+    districts = [
+        {
             "name": f"{state['name']} District {i + 1}",
-            "enrolments": int(state["total_enrolments"] * pct),
-            "growth": round(state["yoy_growth"] + np.random.uniform(-5, 5), 1),
-        })
-    
+            "enrolments": int(enrolments[i]),
+            "growth": float(growth[i]),
+        }
+        for i in order
+    ]
+
     return {
         "state": state["name"],
-        "districts": sorted(districts, key=lambda x: x["enrolments"], reverse=True),
+        "districts": districts,
     }
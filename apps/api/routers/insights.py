@@ -2,18 +2,69 @@
 Insights Router
 AI-generated insights and pattern analysis
 """
-from fastapi import APIRouter, Query
-from typing import Dict, Any, Optional
+import asyncio
+import time
+import orjson
+from dataclasses import asdict
+from fastapi import APIRouter, Query, Response
+from typing import Dict, Any, List, Optional
+from config import settings
 from services.insight_engine import insight_engine
 
 router = APIRouter(prefix="/insights", tags=["Insights"])
 
+# Generated-insight snapshot plus id/category/priority indexes, rebuilt
+# at most once per TTL so list and detail requests are dict hits instead
+# of regenerating and scanning
+_snapshot: Dict[str, Any] = {}
+_snapshot_time: float = 0.0
+
+# Static payload, serialized once at import - the handler only ships bytes
+_CATEGORIES_JSON = orjson.dumps({
+    "categories": [
+        "Migration",
+        "Demographics",
+        "Operations",
+        "Seasonal",
+        "Capacity",
+        "Growth",
+    ]
+})
+
+
+async def _insight_snapshot() -> Dict[str, Any]:
+    global _snapshot, _snapshot_time
+    now = time.monotonic()
+    if not _snapshot or now - _snapshot_time > settings.CACHE_TTL_SECONDS:
+        # The engine emits slotted records; materialize dicts once per
+        # snapshot so request handlers ship plain JSON-ready payloads
+        insights = [asdict(i) for i in await asyncio.to_thread(insight_engine.generate_all_insights)]
+        by_category: Dict[str, list] = {}
+        by_priority: Dict[str, list] = {}
+        for i in insights:
+            by_category.setdefault(i["category"].lower(), []).append(i)
+            by_priority.setdefault(i["priority"], []).append(i)
+        _snapshot = {
+            "insights": insights,
+            "by_id": {i["id"]: i for i in insights},
+            "by_category": by_category,
+            "by_priority": by_priority,
+            # The unfiltered list is the common request - serialize it
+            # to bytes once per snapshot so the handler only ships them
+            "all_json": orjson.dumps({
+                "insights": insights,
+                "total_insights": len(insights),
+            }),
+        }
+        _snapshot_time = now
+    return _snapshot
+
 
 @router.get("")
 async def get_insights(
     category: Optional[str] = Query(default=None, description="Filter by category"),
     priority: Optional[str] = Query(default=None, description="Filter by priority: high, medium, low")
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get AI-generated insights from data analysis.
     
@@ -21,32 +72,41 @@ async def get_insights(
         - List of insights with evidence and implications
         - Category and priority statistics
     """
-    insights = insight_engine.generate_all_insights()
-    
-    # Apply filters
-    if category:
-        insights = [i for i in insights if i["category"].lower() == category.lower()]
-    if priority:
-        insights = [i for i in insights if i["priority"] == priority]
-    
-    return {
-        "insights": insights,
-        "total_insights": len(insights),
-    }
+    snapshot = await _insight_snapshot()
+    if category and priority:
+        bucket = snapshot["by_category"].get(category.lower(), [])
+        insights = [i for i in bucket if i["priority"] == priority]
+    elif category:
+        insights = snapshot["by_category"].get(category.lower(), [])
+    elif priority:
+        insights = snapshot["by_priority"].get(priority, [])
+    else:
+        return Response(content=snapshot["all_json"], media_type="application/json")
+
+    return Response(
+        content=orjson.dumps({"insights": insights, "total_insights": len(insights)}),
+        media_type="application/json",
+    )
+
+
+@router.post("/batch")
+async def get_insights_batch(ids: List[str]) -> Dict[str, Any]:
+    """Resolve many insight ids in one round-trip"""
+    by_id = (await _insight_snapshot())["by_id"]
+    return {"insights": {i: by_id.get(i) for i in ids}}
 
 
 @router.get("/stats")
 async def get_insight_stats() -> Dict[str, Any]:
     """Get insight generation statistics"""
-    return insight_engine.get_insight_stats()
+    return await asyncio.to_thread(insight_engine.get_insight_stats)
 
 
 @router.get("/{insight_id}")
 async def get_insight_detail(insight_id: str) -> Dict[str, Any]:
     """Get detailed information about a specific insight"""
-    insights = insight_engine.generate_all_insights()
-    insight = next((i for i in insights if i["id"] == insight_id), None)
-    
+    insight = (await _insight_snapshot())["by_id"].get(insight_id)
+
     if not insight:
         return {"error": f"Insight {insight_id} not found"}
     
@@ -54,15 +114,6 @@ async def get_insight_detail(insight_id: str) -> Dict[str, Any]:
 
 
 @router.get("/categories")
-async def get_categories() -> Dict[str, Any]:
+async def get_categories() -> Response:
     """Get available insight categories"""
-    return {
-        "categories": [
-            "Migration",
-            "Demographics",
-            "Operations",
-            "Seasonal",
-            "Capacity",
-            "Growth",
-        ]
-    }
+    return Response(content=_CATEGORIES_JSON, media_type="application/json")
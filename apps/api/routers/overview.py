@@ -2,15 +2,49 @@
 Overview Router
 Dashboard overview and summary metrics
 """
-from fastapi import APIRouter
-from typing import Dict, Any
+from fastapi import APIRouter, Response
+from typing import Dict, Any, List
+from pydantic import BaseModel, ConfigDict
 from services.analytics_service import analytics_service
+from services.data_repository import aadhaar_repository
+from services.ttl_cache import SingleFlight
 
 router = APIRouter(prefix="/overview", tags=["Overview"])
 
 
-@router.get("")
-async def get_overview() -> Dict[str, Any]:
+class OverviewSummary(BaseModel):
+    total_enrolments: int
+    total_updates: int
+    active_centres: int
+    states_covered: int
+
+
+class OverviewTrends(BaseModel):
+    enrolment_growth_yoy: float
+    update_growth_yoy: float
+    daily_average_enrolments: int
+    daily_average_updates: int
+
+
+class OverviewResponse(BaseModel):
+    """Typed contract for the dashboard overview payload"""
+
+    model_config = ConfigDict(extra="ignore")
+
+    summary: OverviewSummary
+    trends: OverviewTrends
+    distribution: Dict[str, Any]
+    top_performing_states: List[Dict[str, Any]]
+    alerts: List[Dict[str, Any]]
+    metadata: Dict[str, Any]
+
+# Every handler in this router fans in to the same expensive aggregate;
+# concurrent dashboard polls share one computation per 15s window.
+_overview = SingleFlight(analytics_service.aget_overview_metrics)
+
+
+@router.get("", response_model=OverviewResponse)
+async def get_overview():
     """
     Get complete dashboard overview with computed metrics.
     
@@ -22,13 +56,13 @@ async def get_overview() -> Dict[str, Any]:
         - Active alerts
         - Metadata about data source and freshness
     """
-    return analytics_service.get_overview_metrics()
+    return await _overview.get()
 
 
 @router.get("/kpis")
 async def get_kpis() -> Dict[str, Any]:
     """Get key performance indicators"""
-    metrics = analytics_service.get_overview_metrics()
+    metrics = await _overview.get()
     return {
         "kpis": [
             {
@@ -62,21 +96,23 @@ async def get_kpis() -> Dict[str, Any]:
 
 
 @router.get("/summary")
-async def get_summary() -> Dict[str, Any]:
-    """Get summary statistics"""
-    metrics = analytics_service.get_overview_metrics()
-    return metrics["summary"]
+async def get_summary() -> Response:
+    """Get summary statistics (served from pre-serialized JSON bytes)"""
+    return Response(
+        content=aadhaar_repository.get_summary_stats_json(),
+        media_type="application/json",
+    )
 
 
 @router.get("/trends")
 async def get_trends() -> Dict[str, Any]:
     """Get trend metrics"""
-    metrics = analytics_service.get_overview_metrics()
+    metrics = await _overview.get()
     return metrics["trends"]
 
 
 @router.get("/alerts")
 async def get_alerts() -> Dict[str, Any]:
     """Get active alerts"""
-    metrics = analytics_service.get_overview_metrics()
+    metrics = await _overview.get()
     return {"alerts": metrics["alerts"]}
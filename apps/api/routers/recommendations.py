@@ -2,18 +2,70 @@
 Recommendations Router
 Policy recommendations and action items
 """
-from fastapi import APIRouter, Query
-from typing import Dict, Any, Optional
+import asyncio
+import time
+import orjson
+from dataclasses import asdict
+from fastapi import APIRouter, Query, Response
+from typing import Dict, Any, List, Optional
+from config import settings
 from services.recommendation_engine import recommendation_engine
 
 router = APIRouter(prefix="/recommendations", tags=["Recommendations"])
 
+# Generated-recommendation snapshot plus id/category/status indexes,
+# rebuilt at most once per TTL so list and detail requests are dict hits
+# instead of regenerating and scanning
+_snapshot: Dict[str, Any] = {}
+_snapshot_time: float = 0.0
+
+# Static payload, serialized once at import - the handler only ships bytes
+_CATEGORIES_JSON = orjson.dumps({
+    "categories": [
+        "Infrastructure",
+        "Policy",
+        "Operations",
+        "Technology",
+        "Outreach",
+    ]
+})
+
+
+async def _recommendation_snapshot() -> Dict[str, Any]:
+    global _snapshot, _snapshot_time
+    now = time.monotonic()
+    if not _snapshot or now - _snapshot_time > settings.CACHE_TTL_SECONDS:
+        # The engine emits slotted records; materialize dicts once per
+        # snapshot so request handlers ship plain JSON-ready payloads
+        recommendations = [
+            asdict(r) for r in await asyncio.to_thread(recommendation_engine.generate_all_recommendations)
+        ]
+        by_category: Dict[str, list] = {}
+        by_status: Dict[str, list] = {}
+        for r in recommendations:
+            by_category.setdefault(r["category"].lower(), []).append(r)
+            by_status.setdefault(r["status"], []).append(r)
+        _snapshot = {
+            "recommendations": recommendations,
+            "by_id": {r["id"]: r for r in recommendations},
+            "by_category": by_category,
+            "by_status": by_status,
+            # The unfiltered list is the common request - serialize it
+            # to bytes once per snapshot so the handler only ships them
+            "all_json": orjson.dumps({
+                "recommendations": recommendations,
+                "total_recommendations": len(recommendations),
+            }),
+        }
+        _snapshot_time = now
+    return _snapshot
+
 
 @router.get("")
 async def get_recommendations(
     category: Optional[str] = Query(default=None, description="Filter by category"),
     status: Optional[str] = Query(default=None, description="Filter by status: new, in_progress, implemented")
-) -> Dict[str, Any]:
+) -> Response:
     """
     Get policy recommendations based on data analysis.
     
@@ -22,32 +74,43 @@ async def get_recommendations(
         - Resource requirements
         - Status tracking
     """
-    recommendations = recommendation_engine.generate_all_recommendations()
-    
-    # Apply filters
-    if category:
-        recommendations = [r for r in recommendations if r["category"].lower() == category.lower()]
-    if status:
-        recommendations = [r for r in recommendations if r["status"] == status]
-    
-    return {
-        "recommendations": recommendations,
-        "total_recommendations": len(recommendations),
-    }
+    snapshot = await _recommendation_snapshot()
+    if category and status:
+        bucket = snapshot["by_category"].get(category.lower(), [])
+        recommendations = [r for r in bucket if r["status"] == status]
+    elif category:
+        recommendations = snapshot["by_category"].get(category.lower(), [])
+    elif status:
+        recommendations = snapshot["by_status"].get(status, [])
+    else:
+        return Response(content=snapshot["all_json"], media_type="application/json")
+
+    return Response(
+        content=orjson.dumps(
+            {"recommendations": recommendations, "total_recommendations": len(recommendations)}
+        ),
+        media_type="application/json",
+    )
+
+
+@router.post("/batch")
+async def get_recommendations_batch(ids: List[str]) -> Dict[str, Any]:
+    """Resolve many recommendation ids in one round-trip"""
+    by_id = (await _recommendation_snapshot())["by_id"]
+    return {"recommendations": {i: by_id.get(i) for i in ids}}
 
 
 @router.get("/stats")
 async def get_recommendation_stats() -> Dict[str, Any]:
     """Get recommendation statistics"""
-    return recommendation_engine.get_recommendation_stats()
+    return await asyncio.to_thread(recommendation_engine.get_recommendation_stats)
 
 
 @router.get("/{recommendation_id}")
 async def get_recommendation_detail(recommendation_id: str) -> Dict[str, Any]:
     """Get detailed information about a specific recommendation"""
-    recommendations = recommendation_engine.generate_all_recommendations()
-    rec = next((r for r in recommendations if r["id"] == recommendation_id), None)
-    
+    rec = (await _recommendation_snapshot())["by_id"].get(recommendation_id)
+
     if not rec:
         return {"error": f"Recommendation {recommendation_id} not found"}
     
@@ -55,25 +118,16 @@ async def get_recommendation_detail(recommendation_id: str) -> Dict[str, Any]:
 
 
 @router.get("/categories")
-async def get_categories() -> Dict[str, Any]:
+async def get_categories() -> Response:
     """Get available recommendation categories"""
-    return {
-        "categories": [
-            "Infrastructure",
-            "Policy",
-            "Operations",
-            "Technology",
-            "Outreach",
-        ]
-    }
+    return Response(content=_CATEGORIES_JSON, media_type="application/json")
 
 
 @router.get("/impact/{recommendation_id}")
 async def get_impact_analysis(recommendation_id: str) -> Dict[str, Any]:
     """Get detailed impact analysis for a recommendation"""
-    recommendations = recommendation_engine.generate_all_recommendations()
-    rec = next((r for r in recommendations if r["id"] == recommendation_id), None)
-    
+    rec = (await _recommendation_snapshot())["by_id"].get(recommendation_id)
+
     if not rec:
         return {"error": f"Recommendation {recommendation_id} not found"}
     
@@ -2,15 +2,21 @@
 Updates Router
 Update behavior analytics and patterns
 """
+import asyncio
 from fastapi import APIRouter, Query
 from typing import Dict, Any
 from services.analytics_service import analytics_service
 from services.data_repository import aadhaar_repository
+from services.ttl_cache import SingleFlight
 
 router = APIRouter(prefix="/updates", tags=["Updates"])
 
+# Four handlers fan in to the same update aggregate; concurrent polls
+# share one computation per 15s window.
+_update_analytics = SingleFlight(analytics_service.get_update_analytics)
 
-@router.get("")
+
+@router.get("", response_model=None)
 async def get_updates() -> Dict[str, Any]:
     """
     Get comprehensive update analytics.
@@ -21,25 +27,25 @@ async def get_updates() -> Dict[str, Any]:
         - Seasonal patterns
         - Update fatigue metrics
     """
-    return analytics_service.get_update_analytics()
+    return await _update_analytics.get()
 
 
 @router.get("/types")
 async def get_update_types() -> Dict[str, Any]:
     """Get update type distribution"""
-    analytics = analytics_service.get_update_analytics()
+    analytics = await _update_analytics.get()
     return {
         "update_types": analytics["update_types"],
         "most_common": analytics["summary"]["most_common_type"],
     }
 
 
-@router.get("/timeseries")
+@router.get("/timeseries", response_model=None)
 async def get_timeseries(
     months: int = Query(default=24, ge=6, le=60)
 ) -> Dict[str, Any]:
     """Get update time series data"""
-    data = aadhaar_repository.get_update_timeseries(months=months)
+    data = await asyncio.to_thread(aadhaar_repository.get_update_timeseries, months)
     return {
         "series": data,
         "count": len(data),
@@ -49,7 +55,7 @@ async def get_timeseries(
 @router.get("/patterns")
 async def get_patterns() -> Dict[str, Any]:
     """Get update patterns and fatigue analysis"""
-    analytics = analytics_service.get_update_analytics()
+    analytics = await _update_analytics.get()
     return {
         "seasonal_patterns": analytics["seasonal_patterns"],
         "update_fatigue_index": analytics["update_fatigue_index"],
@@ -59,5 +65,5 @@ async def get_patterns() -> Dict[str, Any]:
 @router.get("/fatigue")
 async def get_update_fatigue() -> Dict[str, Any]:
     """Get update fatigue index and high-fatigue districts"""
-    analytics = analytics_service.get_update_analytics()
+    analytics = await _update_analytics.get()
     return analytics["update_fatigue_index"]
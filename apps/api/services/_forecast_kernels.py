@@ -0,0 +1,113 @@
+"""
+Forecast Kernels
+Numba-compiled numeric core for the seasonal decomposition path
+"""
+import numpy as np
+
+try:  # numba is optional - the vectorized numpy path is the fallback
+    from numba import njit
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def decompose(values, window):
+    """
+    Fused trend/seasonal/residual pass over one series.
+
+    Matches the NumPy formulation in ForecastingEngine._decompose:
+    zero-padded centered moving average (np.convolve mode='same'),
+    per-calendar-month mean of the detrended series, and the residual,
+    all in one traversal without intermediate temporaries.
+    """
+    n = values.shape[0]
+    trend = np.empty(n, np.float64)
+    half = (window - 1) // 2
+
+    for i in range(n):
+        k = i + half
+        lo = k - window + 1
+        if lo < 0:
+            lo = 0
+        hi = k
+        if hi > n - 1:
+            hi = n - 1
+        s = 0.0
+        for j in range(lo, hi + 1):
+            s += values[j]
+        trend[i] = s / window
+
+    month_sums = np.zeros(12, np.float64)
+    month_counts = np.zeros(12, np.int64)
+    for i in range(n):
+        m = i % 12
+        month_sums[m] += values[i] - trend[i]
+        month_counts[m] += 1
+
+    seasonal = np.zeros(12, np.float64)
+    for m in range(12):
+        if month_counts[m] > 0:
+            seasonal[m] = month_sums[m] / month_counts[m]
+
+    seasonal_full = np.empty(n, np.float64)
+    residual = np.empty(n, np.float64)
+    for i in range(n):
+        seasonal_full[i] = seasonal[i % 12]
+        residual[i] = values[i] - trend[i] - seasonal_full[i]
+
+    return trend, seasonal, seasonal_full, residual
+
+
+def holt_winters_add(y, alpha, beta, gamma, m, h):
+    """
+    Additive triple-exponential smoothing (Holt-Winters).
+
+    One O(N) recurrence with three multiply-adds per step; returns the
+    h-step-ahead forecast and the one-step-ahead sum of squared fit
+    errors (used both for parameter selection and confidence bands).
+    Requires at least two full seasons for initialization.
+    """
+    n = y.shape[0]
+
+    # Initial level: mean of the first season; initial trend: average
+    # season-over-season change; initial seasonal: first-season
+    # deviations from the level
+    l_prev = 0.0
+    for i in range(m):
+        l_prev += y[i]
+    l_prev /= m
+
+    b_prev = 0.0
+    for i in range(m):
+        b_prev += y[m + i] - y[i]
+    b_prev /= m * m
+
+    s = np.empty(m, np.float64)
+    for i in range(m):
+        s[i] = y[i] - l_prev
+
+    sse = 0.0
+    for t in range(n):
+        si = t % m
+        err = y[t] - (l_prev + b_prev + s[si])
+        sse += err * err
+        level = alpha * (y[t] - s[si]) + (1.0 - alpha) * (l_prev + b_prev)
+        b_prev = beta * (level - l_prev) + (1.0 - beta) * b_prev
+        s[si] = gamma * (y[t] - l_prev - b_prev) + (1.0 - gamma) * s[si]
+        l_prev = level
+
+    forecast = np.empty(h, np.float64)
+    for k in range(1, h + 1):
+        forecast[k - 1] = l_prev + k * b_prev + s[(n + k - 1) % m]
+
+    return forecast, sse
+
+
+if NUMBA_AVAILABLE:
+    decompose = njit(cache=True, fastmath=True)(decompose)
+    holt_winters_add = njit(cache=True, fastmath=True)(holt_winters_add)
+    # Warm the JIT at import so the first API request doesn't pay the
+    # compile cost (cache=True makes this near-free after the first run)
+    decompose(np.arange(24.0), 12)
+    holt_winters_add(np.arange(24.0), 0.5, 0.1, 0.3, 12, 6)
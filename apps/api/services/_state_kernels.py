@@ -0,0 +1,45 @@
+"""
+State Scoring Kernels
+Numba-compiled masked ranking over the state SoA columns
+"""
+import numpy as np
+
+try:  # numba is optional - the vectorized numpy path is the fallback
+    from numba import njit
+except ImportError:
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+
+def _top_by_field_loop(field, mask):
+    """
+    Index of the largest masked value, -1 when the mask is empty.
+
+    One fused traversal with no temporaries - at the current ~35 states
+    this matches numpy, but it stays O(N) with constant memory as the
+    data grows to district or PIN-code granularity.
+    """
+    best = -1
+    best_val = -np.inf
+    for i in range(field.shape[0]):
+        if mask[i] and field[i] > best_val:
+            best_val = field[i]
+            best = i
+    return best
+
+
+def _top_by_field_numpy(field, mask):
+    if not mask.any():
+        return -1
+    return int(np.argmax(np.where(mask, field, -np.inf)))
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signature compiles at import so the first request never
+    # pays the JIT cost (cache=True makes reruns near-free)
+    top_by_field = njit(
+        "int64(float64[::1], boolean[::1])", cache=True
+    )(_top_by_field_loop)
+else:
+    top_by_field = _top_by_field_numpy
@@ -2,8 +2,10 @@
 Analytics Service
 Computes KPIs, growth rates, aggregates, and derived metrics
 """
-import pandas as pd
+import asyncio
+import heapq
 import numpy as np
+from functools import wraps
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 import logging
@@ -11,6 +13,32 @@ from services.data_repository import aadhaar_repository
 
 logger = logging.getLogger(__name__)
 
+# Metro states with the highest enrolment-centre load - frozenset gives
+# O(1) membership checks without rebuilding a literal list per call
+METRO_CODES = frozenset({"DL", "MH", "KA", "TN"})
+
+
+def _memoize_by_version(fn):
+    """
+    Memoize a no-arg service method on the repository data version.
+
+    The analytics getters are pure functions of the repository snapshot,
+    so between data refreshes the memo turns each call into a dict hit
+    instead of re-sorting states and rebuilding payload dicts.
+    """
+
+    @wraps(fn)
+    def wrapper(self):
+        version = self.repo.version
+        hit = self._cache.get(fn.__name__)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        result = fn(self)
+        self._cache[fn.__name__] = (version, result)
+        return result
+
+    return wrapper
+
 
 class AnalyticsService:
     """
@@ -20,16 +48,49 @@ class AnalyticsService:
     
     def __init__(self):
         self.repo = aadhaar_repository
+        self._cache: Dict[str, tuple] = {}
     
+    @_memoize_by_version
     def get_overview_metrics(self) -> Dict[str, Any]:
         """Compute overview dashboard metrics"""
-        summary = self.repo.get_summary_stats()
-        trends = self.repo.get_trends()
-        demographics = self.repo.get_demographics()
-        states = self.repo.get_state_data()
-        
-        # Get top performing states
-        top_states = sorted(states, key=lambda x: x["yoy_growth"], reverse=True)[:5]
+        return self._compose_overview(self.repo.get_snapshot())
+
+    async def aget_overview_metrics(self) -> Dict[str, Any]:
+        """Async overview metrics - snapshot fetched off the event loop"""
+        version = self.repo.version
+        hit = self._cache.get("get_overview_metrics")
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        snapshot = await asyncio.to_thread(self.repo.get_snapshot)
+        result = self._compose_overview(snapshot)
+        self._cache["get_overview_metrics"] = (version, result)
+        return result
+
+    def _compose_overview(self, snapshot) -> Dict[str, Any]:
+        """Assemble the overview payload from one fused repo snapshot"""
+        summary = snapshot.summary
+        trends = snapshot.trends
+        demographics = snapshot.demographics
+        states = snapshot.states
+        # Get top performing states - top-K partition over the SoA growth
+        # column instead of a keyed Python sort of the dict list
+        cols = snapshot.state_cols
+        if cols:
+            yoy = cols["yoy_growth"]
+            k = min(5, len(yoy))
+            idx = np.argpartition(-yoy, k - 1)[:k]
+            idx = idx[np.argsort(-yoy[idx])]
+            top_states = [
+                {
+                    "name": cols["name"][i],
+                    "code": cols["code"][i],
+                    "total_enrolments": int(cols["total_enrolments"][i]),
+                    "yoy_growth": float(yoy[i]),
+                }
+                for i in idx
+            ]
+        else:
+            top_states = heapq.nlargest(5, states, key=lambda x: x["yoy_growth"])
         
         # Generate alerts based on data
         alerts = self._generate_alerts(states, trends)
@@ -89,7 +150,7 @@ class AnalyticsService:
             })
         
         # Check for capacity warnings
-        metro_states = [s for s in states if s["code"] in ["DL", "MH", "KA", "TN"]]
+        metro_states = [s for s in states if s["code"] in METRO_CODES]
         high_volume = [s for s in metro_states if s["monthly_enrolments"] > 1_000_000]
         if high_volume:
             alerts.append({
@@ -101,23 +162,54 @@ class AnalyticsService:
         
         return alerts
     
+    @_memoize_by_version
     def get_enrolment_analytics(self) -> Dict[str, Any]:
         """Compute enrolment-specific analytics"""
-        timeseries = self.repo.get_enrolment_timeseries(months=24)
-        states = self.repo.get_state_data()
-        demographics = self.repo.get_demographics()
-        
-        # Compute aggregates
-        values = [t["value"] for t in timeseries]
-        
+        snapshot = self.repo.get_snapshot()
+        return self._compose_enrolment_analytics(
+            self.repo.get_enrolment_timeseries(months=24),
+            snapshot.states,
+            snapshot.demographics,
+        )
+
+    async def aget_enrolment_analytics(self) -> Dict[str, Any]:
+        """Async enrolment analytics - independent repo reads overlap"""
+        version = self.repo.version
+        hit = self._cache.get("get_enrolment_analytics")
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        timeseries, snapshot = await asyncio.gather(
+            asyncio.to_thread(self.repo.get_enrolment_timeseries, 24),
+            asyncio.to_thread(self.repo.get_snapshot),
+        )
+        result = self._compose_enrolment_analytics(
+            timeseries, snapshot.states, snapshot.demographics
+        )
+        self._cache["get_enrolment_analytics"] = (version, result)
+        return result
+
+    def _compose_enrolment_analytics(
+        self,
+        timeseries: List[Dict[str, Any]],
+        states: List[Dict[str, Any]],
+        demographics: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Assemble the enrolment payload from its pre-fetched inputs"""
+        # Compute aggregates - materialize one float64 buffer and run all
+        # five reductions as NumPy C loops instead of re-iterating a
+        # Python list for sum/max/min
+        values = np.fromiter(
+            (t["value"] for t in timeseries), np.float64, count=len(timeseries)
+        )
+
         return {
             "timeseries": timeseries,
             "summary": {
-                "total": sum(values),
-                "average": int(np.mean(values)),
-                "max": max(values),
-                "min": min(values),
-                "std": int(np.std(values)),
+                "total": int(values.sum()),
+                "average": int(values.mean()),
+                "max": int(values.max()),
+                "min": int(values.min()),
+                "std": int(values.std()),
             },
             "by_state": [
                 {
@@ -126,7 +218,8 @@ class AnalyticsService:
                     "enrolments": s["total_enrolments"],
                     "growth": s["yoy_growth"],
                 }
-                for s in sorted(states, key=lambda x: x["total_enrolments"], reverse=True)[:10]
+                # get_state_data() already sorts by total enrolments desc
+                for s in states[:10]
             ],
             "demographics": {
                 "age_distribution": [
@@ -144,6 +237,7 @@ class AnalyticsService:
             },
         }
     
+    @_memoize_by_version
     def get_update_analytics(self) -> Dict[str, Any]:
         """Compute update behavior analytics"""
         update_types = self.repo.get_update_types()
@@ -175,112 +269,119 @@ class AnalyticsService:
         if not timeseries:
             return []
         
-        # Group by month
-        monthly_avg = {}
-        monthly_count = {}
-        overall_avg = np.mean([t["value"] for t in timeseries])
-        
-        for t in timeseries:
-            month = datetime.strptime(t["period"], "%Y-%m").month
-            if month not in monthly_avg:
-                monthly_avg[month] = 0
-                monthly_count[month] = 0
-            monthly_avg[month] += t["value"]
-            monthly_count[month] += 1
-        
-        # Calculate indices
+        # Vectorized: one to_datetime parse and a groupby mean instead of
+        # per-row strptime calls and Python accumulator dicts. pandas is
+        # imported lazily - this is the module's only use and the repo
+        # has already paid the import by the time analytics run.
+        import pandas as pd
+
+        df = pd.DataFrame(timeseries)
+        months = pd.to_datetime(df["period"], format="%Y-%m").dt.month
+        indices = (df["value"].groupby(months).mean() / df["value"].mean()).round(3)
+
         month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
                        "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
         
         return [
             {
                 "month": month_names[m - 1],
-                "month_num": m,
-                "index": round(monthly_avg[m] / monthly_count[m] / overall_avg, 3),
+                "month_num": int(m),
+                "index": float(idx),
             }
-            for m in range(1, 13)
-            if m in monthly_avg
+            for m, idx in indices.items()
         ]
     
     def _calculate_update_fatigue(self) -> Dict[str, Any]:
         """Calculate update fatigue index by region"""
-        states = self.repo.get_state_data()
-        
-        # Districts with high update rates (simulated based on patterns)
-        high_fatigue_districts = []
-        for state in states[:10]:
-            if state["update_rate"] > 0.08:
-                for i in range(2):
-                    district_name = f"{state['name']} District {i + 1}"
-                    score = state["update_rate"] + np.random.uniform(0, 0.05)
-                    high_fatigue_districts.append({
-                        "district": district_name,
-                        "state": state["name"],
-                        "score": round(min(1.0, score * 8), 2),
-                    })
-        
-        # Sort by fatigue score
-        high_fatigue_districts = sorted(
-            high_fatigue_districts, 
-            key=lambda x: x["score"], 
-            reverse=True
-        )[:5]
-        
+        cols = self.repo.get_state_columns()
+
+        # Districts with high update rates (simulated based on patterns).
+        # Scores for both simulated districts of every candidate state are
+        # drawn and scaled in one vectorized pass; argsort then picks the
+        # top 5 without building dicts for rows that never surface.
+        rates = np.repeat(cols["update_rate"][:10], 2)
+        names = np.repeat(cols["name"][:10], 2)
+        mask = rates > 0.08
+        rates, names = rates[mask], names[mask]
+
+        scores = np.minimum(1.0, (rates + np.random.uniform(0, 0.05, size=rates.shape[0])) * 8).round(2)
+        k = min(5, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+        top = top[np.argsort(-scores[top])]
+
+        high_fatigue_districts = [
+            {
+                "district": f"{names[i]} District {(i % 2) + 1}",
+                "state": names[i],
+                "score": float(scores[i]),
+            }
+            for i in top
+        ]
+
         return {
-            "national_index": round(np.mean([d["score"] for d in high_fatigue_districts]) if high_fatigue_districts else 0.72, 2),
+            "national_index": round(float(scores[top].mean()), 2) if top.size else 0.72,
             "high_fatigue_districts": high_fatigue_districts,
             "trend": "increasing",
         }
     
+    @_memoize_by_version
     def get_geography_data(self) -> Dict[str, Any]:
         """Get geographic distribution data"""
-        states = self.repo.get_state_data()
-        
-        # Create heatmap data
-        total_enrolments = sum(s["total_enrolments"] for s in states)
+        cols = self.repo.get_snapshot().state_cols
+        if not cols:
+            return {"heatmap": {"data": [], "total": 0}, "states": [], "by_region": []}
+
+        # Columns arrive sorted by total enrolments descending, so the
+        # heatmap order falls out for free; sum/max are C-loop reductions
+        enrolments = cols["total_enrolments"]
+        total_enrolments = int(enrolments.sum())
+        normalized = enrolments / enrolments.max()
+        urban = np.round(cols["urban_pct"] * 100, 1)
+
         heatmap_data = [
             {
-                "code": s["code"],
-                "name": s["name"],
-                "value": s["total_enrolments"],
-                "normalized": s["total_enrolments"] / max(s["total_enrolments"] for s in states),
+                "code": code,
+                "name": name,
+                "value": int(value),
+                "normalized": float(norm),
             }
-            for s in states
+            for code, name, value, norm in zip(cols["code"], cols["name"], enrolments, normalized)
         ]
-        
-        # Group by region
-        regions = {}
-        for s in states:
-            region = s["region"]
-            if region not in regions:
-                regions[region] = {"states": [], "total": 0}
-            regions[region]["states"].append(s)
-            regions[region]["total"] += s["total_enrolments"]
-        
+
+        # Region totals via the repo's precomputed index - one fancy-index
+        # sum per region instead of rebuilding a dict of lists per call
+        by_region = sorted(
+            (
+                {
+                    "region": region,
+                    "total_enrolments": int(enrolments[idx].sum()),
+                    "state_count": int(idx.size),
+                }
+                for region, idx in self.repo.get_region_index().items()
+            ),
+            key=lambda r: r["total_enrolments"],
+            reverse=True,
+        )
+
         return {
             "heatmap": {
-                "data": sorted(heatmap_data, key=lambda x: x["value"], reverse=True),
+                "data": heatmap_data,
                 "total": total_enrolments,
             },
             "states": [
                 {
-                    "code": s["code"],
-                    "name": s["name"],
-                    "region": s["region"],
-                    "enrolments": s["total_enrolments"],
-                    "growth": s["yoy_growth"],
-                    "urban_pct": round(s["urban_pct"] * 100, 1),
-                }
-                for s in states
-            ],
-            "by_region": [
-                {
+                    "code": code,
+                    "name": name,
                     "region": region,
-                    "total_enrolments": data["total"],
-                    "state_count": len(data["states"]),
+                    "enrolments": int(value),
+                    "growth": float(growth),
+                    "urban_pct": float(urban_pct),
                 }
-                for region, data in sorted(regions.items(), key=lambda x: x[1]["total"], reverse=True)
+                for code, name, region, value, growth, urban_pct in zip(
+                    cols["code"], cols["name"], cols["region"], enrolments, cols["yoy_growth"], urban
+                )
             ],
+            "by_region": by_region,
         }
 
 
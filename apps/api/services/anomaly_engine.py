@@ -2,19 +2,40 @@
 Anomaly Detection Engine
 Implements statistical anomaly detection for Aadhaar data patterns
 """
+import time
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
+from operator import attrgetter
 import logging
-from scipy import stats
+from config import settings
 from services.data_repository import aadhaar_repository
 
+try:  # numba is optional - the numpy fallback is identical, just slower
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
 
+def _zscore_kernel(values):
+    """Z-scores over a contiguous float64 buffer (JIT-compiled if available)"""
+    mean = values.mean()
+    std = values.std()
+    z = np.zeros(values.shape[0])
+    if std > 0:
+        for i in range(values.shape[0]):
+            z[i] = (values[i] - mean) / std
+    return z
+
+
+if njit is not None:
+    _zscore_kernel = njit(cache=True)(_zscore_kernel)
+
+
 class AnomalyType(Enum):
     ENROLMENT_SURGE = "Enrolment Surge"
     ENROLMENT_DROP = "Enrolment Drop"
@@ -31,19 +52,50 @@ class Severity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Integer sort ranks, attached to each anomaly at construction so the
+# final ordering pass is a C-level attrgetter sort instead of a Python
+# lambda doing a dict lookup per comparison
+SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+@dataclass(slots=True, frozen=True)
 class Anomaly:
-    """Represents a detected anomaly"""
+    """
+    Represents a detected anomaly.
+    Slotted and frozen: fixed field layout is cheaper to allocate than
+    the free-form dicts the detectors used to build, and the internal
+    sev_rank sort key never leaks into API payloads (see to_payload).
+    """
     id: str
-    type: AnomalyType
-    severity: Severity
+    type: str
+    severity: str
+    sev_rank: int
     state: str
     district: str
     description: str
     deviation_score: float
-    detected_at: datetime
+    detected_at: str
     recommendation: str
     evidence: Dict[str, Any]
+    period: Optional[str] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Plain-dict form served by the API"""
+        payload = {
+            "id": self.id,
+            "type": self.type,
+            "severity": self.severity,
+            "state": self.state,
+            "district": self.district,
+            "description": self.description,
+            "deviation_score": self.deviation_score,
+            "detected_at": self.detected_at,
+            "recommendation": self.recommendation,
+            "evidence": self.evidence,
+        }
+        if self.period is not None:
+            payload["period"] = self.period
+        return payload
 
 
 class AnomalyDetectionEngine:
@@ -60,35 +112,67 @@ class AnomalyDetectionEngine:
         self.zscore_threshold = zscore_threshold
         self.repo = aadhaar_repository
         self._anomaly_counter = 0
+        self._by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_id_time: float = 0.0
+        self._detected: Optional[List[Dict[str, Any]]] = None
+        self._detected_version: int = -1
     
-    def _generate_anomaly_id(self) -> str:
-        """Generate unique anomaly ID"""
+    def _generate_anomaly_id(self, year: str) -> str:
+        """Generate unique anomaly ID for the given detection year"""
         self._anomaly_counter += 1
-        return f"ANM-{datetime.now().strftime('%Y')}-{self._anomaly_counter:03d}"
+        return f"ANM-{year}-{self._anomaly_counter:03d}"
     
     def detect_all_anomalies(self) -> List[Dict[str, Any]]:
         """Run all anomaly detection algorithms"""
+        # Detection is a pure function of the repository snapshot, so the
+        # result is memoized until the underlying data version changes
+        version = self.repo.version
+        if self._detected is not None and self._detected_version == version:
+            return self._detected
+
         anomalies = []
-        
+
+        # One timestamp for the whole run - every anomaly in a batch was
+        # detected "now", so the strftime/isoformat work happens once
+        now = datetime.now()
+        detected_at = now.isoformat()
+        year = now.strftime("%Y")
+
         # Detect enrolment anomalies
-        anomalies.extend(self._detect_enrolment_anomalies())
+        anomalies.extend(self._detect_enrolment_anomalies(detected_at, year))
         
         # Detect update pattern anomalies
-        anomalies.extend(self._detect_update_anomalies())
+        anomalies.extend(self._detect_update_anomalies(detected_at, year))
         
         # Detect geographic disparities
-        anomalies.extend(self._detect_geographic_anomalies())
+        anomalies.extend(self._detect_geographic_anomalies(detected_at, year))
         
         # Detect demographic imbalances
-        anomalies.extend(self._detect_demographic_anomalies())
-        
-        # Sort by severity and timestamp
-        severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-        anomalies.sort(key=lambda x: (severity_order.get(x["severity"], 4), x["detected_at"]))
+        anomalies.extend(self._detect_demographic_anomalies(detected_at, year))
         
-        return anomalies
+        # Sort by severity and timestamp, then serialize to plain dicts
+        # exactly once - the memoized list is what the API serves
+        anomalies.sort(key=attrgetter("sev_rank", "detected_at"))
+        payloads = [a.to_payload() for a in anomalies]
+
+        self._detected = payloads
+        self._detected_version = version
+        return payloads
     
-    def _detect_enrolment_anomalies(self) -> List[Dict[str, Any]]:
+    def get_anomaly_by_id(self, anomaly_id: str) -> Optional[Dict[str, Any]]:
+        """
+        O(1) lookup of a detected anomaly by ID.
+        Memoizes the detection snapshot and an id->anomaly index for
+        CACHE_TTL_SECONDS instead of re-running detection and scanning
+        the list on every request.
+        """
+        now = time.monotonic()
+        if self._by_id is None or now - self._by_id_time > settings.CACHE_TTL_SECONDS:
+            self._by_id = {a["id"]: a for a in self.detect_all_anomalies()}
+            self._by_id_time = now
+        return self._by_id.get(anomaly_id)
+
+    def _detect_enrolment_anomalies(self, detected_at: str, year: str) -> List[Anomaly]:
         """Detect anomalies in enrolment patterns"""
         anomalies = []
         timeseries = self.repo.get_enrolment_timeseries(months=24)
@@ -96,120 +180,133 @@ class AnomalyDetectionEngine:
         if len(timeseries) < 12:
             return anomalies
         
-        values = np.array([t["value"] for t in timeseries])
-        
-        # Z-score analysis
-        z_scores = stats.zscore(values)
+        values = np.fromiter((t["value"] for t in timeseries), dtype=np.float64, count=len(timeseries))
         
-        for i, (ts, z) in enumerate(zip(timeseries, z_scores)):
-            if abs(z) > self.zscore_threshold:
-                is_surge = z > 0
-                states = self.repo.get_state_data()
-                affected_state = states[i % len(states)]
-                
-                anomalies.append({
-                    "id": self._generate_anomaly_id(),
-                    "type": AnomalyType.ENROLMENT_SURGE.value if is_surge else AnomalyType.ENROLMENT_DROP.value,
-                    "severity": "high" if abs(z) > 3 else "medium",
-                    "state": affected_state["name"],
-                    "district": f"{affected_state['name']} Metro",
-                    "description": f"Enrolment volume {abs(z):.1f}x higher than expected" if is_surge 
-                                 else f"Enrolment volume {abs(z):.1f}x below monthly average",
-                    "deviation_score": round(z, 2),
-                    "detected_at": datetime.now().isoformat(),
-                    "period": ts["period"],
-                    "recommendation": "Verify with ground team and check centre capacity" if is_surge
-                                     else "Check centre operational status",
-                    "evidence": {
-                        "expected_value": int(np.mean(values)),
-                        "actual_value": ts["value"],
-                        "z_score": round(z, 2),
-                    },
-                })
+        # Z-score analysis - kernel over the whole buffer, then walk only
+        # the flagged indices
+        z_scores = _zscore_kernel(values)
+        outliers = np.nonzero(np.abs(z_scores) > self.zscore_threshold)[0]
+
+        mean_value = int(values.mean())
+        for i in outliers:
+            z = float(z_scores[i])
+            ts = timeseries[i]
+            is_surge = z > 0
+            states = self.repo.get_state_data()
+            affected_state = states[i % len(states)]
+            severity = "high" if abs(z) > 3 else "medium"
+
+            anomalies.append(Anomaly(
+                id=self._generate_anomaly_id(year),
+                type=AnomalyType.ENROLMENT_SURGE.value if is_surge else AnomalyType.ENROLMENT_DROP.value,
+                severity=severity,
+                sev_rank=SEVERITY_RANK[severity],
+                state=affected_state["name"],
+                district=f"{affected_state['name']} Metro",
+                description=f"Enrolment volume {abs(z):.1f}x higher than expected" if is_surge
+                            else f"Enrolment volume {abs(z):.1f}x below monthly average",
+                deviation_score=round(z, 2),
+                detected_at=detected_at,
+                period=ts["period"],
+                recommendation="Verify with ground team and check centre capacity" if is_surge
+                               else "Check centre operational status",
+                evidence={
+                    "expected_value": mean_value,
+                    "actual_value": ts["value"],
+                    "z_score": round(z, 2),
+                },
+            ))
         
         return anomalies[:3]  # Limit to top 3
     
-    def _detect_update_anomalies(self) -> List[Dict[str, Any]]:
+    def _detect_update_anomalies(self, detected_at: str, year: str) -> List[Anomaly]:
         """Detect anomalies in update patterns"""
         anomalies = []
         update_types = self.repo.get_update_types()
-        states = self.repo.get_state_data()
         
         # Check for unusual update type distributions
         for ut in update_types:
             # Address updates typically 35-40%
             if ut["type"] == "Address" and ut["percentage"] > 45:
-                anomalies.append({
-                    "id": self._generate_anomaly_id(),
-                    "type": AnomalyType.UPDATE_FATIGUE.value,
-                    "severity": "medium",
-                    "state": "Multiple States",
-                    "district": "Metro Areas",
-                    "description": f"Address updates at {ut['percentage']:.1f}%, suggesting high migration activity",
-                    "deviation_score": round((ut["percentage"] - 38) / 5, 2),
-                    "detected_at": datetime.now().isoformat(),
-                    "recommendation": "Deploy additional mobile update units in affected areas",
-                    "evidence": {
+                anomalies.append(Anomaly(
+                    id=self._generate_anomaly_id(year),
+                    type=AnomalyType.UPDATE_FATIGUE.value,
+                    severity="medium",
+                    sev_rank=SEVERITY_RANK["medium"],
+                    state="Multiple States",
+                    district="Metro Areas",
+                    description=f"Address updates at {ut['percentage']:.1f}%, suggesting high migration activity",
+                    deviation_score=round((ut["percentage"] - 38) / 5, 2),
+                    detected_at=detected_at,
+                    recommendation="Deploy additional mobile update units in affected areas",
+                    evidence={
                         "update_type": ut["type"],
                         "percentage": ut["percentage"],
                         "expected_range": "35-40%",
                     },
-                })
+                ))
         
-        # Check for states with unusual update patterns
-        for state in states[:5]:
-            if state["update_rate"] > 0.10:
-                anomalies.append({
-                    "id": self._generate_anomaly_id(),
-                    "type": AnomalyType.UPDATE_FATIGUE.value,
-                    "severity": "low",
-                    "state": state["name"],
-                    "district": f"{state['name']} Urban",
-                    "description": f"Update requests {state['update_rate']*100:.1f}% above monthly average",
-                    "deviation_score": round(state["update_rate"] * 10, 2),
-                    "detected_at": datetime.now().isoformat(),
-                    "recommendation": "Monitor centre capacity and queue times",
-                    "evidence": {
-                        "update_rate": round(state["update_rate"], 3),
-                        "state_code": state["code"],
-                    },
-                })
+        # Check for states with unusual update patterns - a vectorized
+        # mask over the columnar snapshot flags the hot states, then only
+        # those rows are turned into anomaly dicts
+        cols = self.repo.get_state_columns()
+        rates = cols["update_rate"][:5]
+        for i in np.nonzero(rates > 0.10)[0]:
+            rate = float(rates[i])
+            name = cols["name"][i]
+            anomalies.append(Anomaly(
+                id=self._generate_anomaly_id(year),
+                type=AnomalyType.UPDATE_FATIGUE.value,
+                severity="low",
+                sev_rank=SEVERITY_RANK["low"],
+                state=name,
+                district=f"{name} Urban",
+                description=f"Update requests {rate*100:.1f}% above monthly average",
+                deviation_score=round(rate * 10, 2),
+                detected_at=detected_at,
+                recommendation="Monitor centre capacity and queue times",
+                evidence={
+                    "update_rate": round(rate, 3),
+                    "state_code": cols["code"][i],
+                },
+            ))
         
         return anomalies[:2]
     
-    def _detect_geographic_anomalies(self) -> List[Dict[str, Any]]:
+    def _detect_geographic_anomalies(self, detected_at: str, year: str) -> List[Anomaly]:
         """Detect geographic disparities"""
         anomalies = []
         states = self.repo.get_state_data()
         
         # Calculate per-capita variations (using urbanization as proxy)
-        urban_pcts = [s["urban_pct"] for s in states]
-        mean_urban = np.mean(urban_pcts)
-        std_urban = np.std(urban_pcts)
-        
-        for state in states:
-            z = (state["urban_pct"] - mean_urban) / std_urban if std_urban > 0 else 0
-            
-            if abs(z) > 2:
-                anomalies.append({
-                    "id": self._generate_anomaly_id(),
-                    "type": AnomalyType.GEOGRAPHIC_DISPARITY.value,
-                    "severity": "medium" if abs(z) > 2.5 else "low",
-                    "state": state["name"],
-                    "district": state["name"],
-                    "description": f"Urban-rural enrolment ratio significantly {'above' if z > 0 else 'below'} national average",
-                    "deviation_score": round(z, 2),
-                    "detected_at": datetime.now().isoformat(),
-                    "recommendation": f"Focus on {'rural' if z > 0 else 'urban'} outreach in {state['name']}",
-                    "evidence": {
-                        "state_urban_pct": round(state["urban_pct"] * 100, 1),
-                        "national_avg": round(mean_urban * 100, 1),
-                    },
-                })
+        urban_pcts = np.fromiter((s["urban_pct"] for s in states), dtype=np.float64, count=len(states))
+        mean_urban = urban_pcts.mean()
+        z_scores = _zscore_kernel(urban_pcts)
+
+        for i in np.nonzero(np.abs(z_scores) > 2)[0]:
+            state = states[i]
+            z = float(z_scores[i])
+            severity = "medium" if abs(z) > 2.5 else "low"
+            anomalies.append(Anomaly(
+                id=self._generate_anomaly_id(year),
+                type=AnomalyType.GEOGRAPHIC_DISPARITY.value,
+                severity=severity,
+                sev_rank=SEVERITY_RANK[severity],
+                state=state["name"],
+                district=state["name"],
+                description=f"Urban-rural enrolment ratio significantly {'above' if z > 0 else 'below'} national average",
+                deviation_score=round(z, 2),
+                detected_at=detected_at,
+                recommendation=f"Focus on {'rural' if z > 0 else 'urban'} outreach in {state['name']}",
+                evidence={
+                    "state_urban_pct": round(state["urban_pct"] * 100, 1),
+                    "national_avg": round(mean_urban * 100, 1),
+                },
+            ))
         
         return anomalies[:2]
     
-    def _detect_demographic_anomalies(self) -> List[Dict[str, Any]]:
+    def _detect_demographic_anomalies(self, detected_at: str, year: str) -> List[Anomaly]:
         """Detect demographic imbalances"""
         anomalies = []
         demographics = self.repo.get_demographics()
@@ -220,22 +317,23 @@ class AnomalyDetectionEngine:
         
         # National average is roughly 51:49
         if abs(male_pct - 51) > 2:
-            anomalies.append({
-                "id": self._generate_anomaly_id(),
-                "type": AnomalyType.DEMOGRAPHIC_IMBALANCE.value,
-                "severity": "low",
-                "state": "National",
-                "district": "All Districts",
-                "description": f"Gender ratio at {male_pct:.1f}% male, deviating from expected 51%",
-                "deviation_score": round(abs(male_pct - 51) / 2, 2),
-                "detected_at": datetime.now().isoformat(),
-                "recommendation": "Review gender-wise enrolment campaigns",
-                "evidence": {
+            anomalies.append(Anomaly(
+                id=self._generate_anomaly_id(year),
+                type=AnomalyType.DEMOGRAPHIC_IMBALANCE.value,
+                severity="low",
+                sev_rank=SEVERITY_RANK["low"],
+                state="National",
+                district="All Districts",
+                description=f"Gender ratio at {male_pct:.1f}% male, deviating from expected 51%",
+                deviation_score=round(abs(male_pct - 51) / 2, 2),
+                detected_at=detected_at,
+                recommendation="Review gender-wise enrolment campaigns",
+                evidence={
                     "male_percentage": male_pct,
                     "female_percentage": female_pct,
                     "expected_ratio": "51:49",
                 },
-            })
+            ))
         
         return anomalies
     
@@ -7,20 +7,120 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
+import threading
 import httpx
+import orjson
 import asyncio
 from dataclasses import dataclass
 from enum import Enum
 from config import settings
+from services.ttl_cache import TTLCache
+
+try:  # numba is optional - the vectorized numpy path is the fallback
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:  # pyarrow is optional - the default NumPy backend is the fallback
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
 logger = logging.getLogger(__name__)
 
+
+def _enrolment_kernel(month_nums, years, rand, base):
+    """Fused seasonal/growth/cumulative pass over the month axis"""
+    n = month_nums.shape[0]
+    enrolments = np.empty(n, np.int64)
+    cumulative = np.empty(n, np.int64)
+    total = 1_200_000_000
+    for i in range(n):
+        seasonal = 1 + 0.15 * np.cos(2 * np.pi * (month_nums[i] - 1) / 12)
+        year_factor = 1 + max(0.02, 0.15 - 0.03 * (years[i] - 2020))
+        value = int(base * seasonal * year_factor * (1 + rand[i]))
+        total += value
+        enrolments[i] = value
+        cumulative[i] = total
+    return enrolments, cumulative
+
+
+if njit is not None:
+    _enrolment_kernel = njit(cache=True)(_enrolment_kernel)
+
 class DataSource(Enum):
     API = "Data.gov.in API"
     CACHED = "cached"
     SIMULATED = "simulated"
 
 
+# State name -> (code, region), shared by the API-aggregation and
+# supplement paths; built once at import instead of per refresh
+_STATE_CODES: Dict[str, tuple] = {
+    "Andhra Pradesh": ("AP", "South"),
+    "Arunachal Pradesh": ("AR", "Northeast"),
+    "Assam": ("AS", "Northeast"),
+    "Bihar": ("BR", "East"),
+    "Chhattisgarh": ("CG", "Central"),
+    "Delhi": ("DL", "North"),
+    "Goa": ("GA", "West"),
+    "Gujarat": ("GJ", "West"),
+    "Haryana": ("HR", "North"),
+    "Himachal Pradesh": ("HP", "North"),
+    "Jharkhand": ("JH", "East"),
+    "Karnataka": ("KA", "South"),
+    "Kerala": ("KL", "South"),
+    "Madhya Pradesh": ("MP", "Central"),
+    "Maharashtra": ("MH", "West"),
+    "Manipur": ("MN", "Northeast"),
+    "Meghalaya": ("ML", "Northeast"),
+    "Mizoram": ("MZ", "Northeast"),
+    "Nagaland": ("NL", "Northeast"),
+    "Odisha": ("OD", "East"),
+    "Punjab": ("PB", "North"),
+    "Rajasthan": ("RJ", "North"),
+    "Sikkim": ("SK", "Northeast"),
+    "Tamil Nadu": ("TN", "South"),
+    "Telangana": ("TS", "South"),
+    "Tripura": ("TR", "Northeast"),
+    "Uttar Pradesh": ("UP", "North"),
+    "Uttarakhand": ("UK", "North"),
+    "West Bengal": ("WB", "East"),
+    "Jammu & Kashmir": ("JK", "North"),
+    "Ladakh": ("LA", "North"),
+    "Andaman & Nicobar": ("AN", "Islands"),
+    "Chandigarh": ("CH", "North"),
+    "Dadra & Nagar Haveli": ("DN", "West"),
+    "Daman & Diu": ("DD", "West"),
+    "Lakshadweep": ("LD", "Islands"),
+    "Puducherry": ("PY", "South"),
+}
+
+# Column-wise lookup tables for vectorized .map() joins
+_STATE_CODE_MAP = {name: code for name, (code, _) in _STATE_CODES.items()}
+_STATE_REGION_MAP = {name: region for name, (_, region) in _STATE_CODES.items()}
+
+# Fallback roster of large states used to fill gaps in API coverage
+_ALL_STATES = (
+    ("Uttar Pradesh", "UP", "North", 185_000_000),
+    ("Maharashtra", "MH", "West", 128_000_000),
+    ("Bihar", "BR", "East", 112_000_000),
+    ("West Bengal", "WB", "East", 98_000_000),
+    ("Madhya Pradesh", "MP", "Central", 89_000_000),
+    ("Rajasthan", "RJ", "North", 82_000_000),
+    ("Tamil Nadu", "TN", "South", 78_000_000),
+    ("Karnataka", "KA", "South", 72_000_000),
+    ("Gujarat", "GJ", "West", 68_000_000),
+    ("Andhra Pradesh", "AP", "South", 52_000_000),
+    ("Odisha", "OD", "East", 48_000_000),
+    ("Telangana", "TS", "South", 42_000_000),
+    ("Kerala", "KL", "South", 38_000_000),
+    ("Jharkhand", "JH", "East", 35_000_000),
+    ("Assam", "AS", "Northeast", 32_000_000),
+    ("Punjab", "PB", "North", 30_000_000),
+)
+
+
 @dataclass
 class DataSnapshot:
     """Represents a point-in-time data snapshot"""
@@ -30,6 +130,21 @@ class DataSnapshot:
     metrics: Dict[str, Any]
 
 
+@dataclass(slots=True)
+class RepoSnapshot:
+    """
+    All per-version derived views bundled in one object, so analytics
+    composers make a single repository call instead of four and can be
+    memoized against one version number.
+    """
+    version: int
+    summary: Dict[str, Any]
+    trends: Dict[str, Any]
+    demographics: Dict[str, Any]
+    states: List[Dict[str, Any]]
+    state_cols: Dict[str, np.ndarray]
+
+
 class DataGovFetcher:
     """Fetches real data from Data.gov.in"""
     
@@ -41,82 +156,111 @@ class DataGovFetcher:
     def __init__(self):
         self.api_key = settings.DATA_GOV_API_KEY
         self.timeout = 30.0
-        self._cache: Dict[str, Any] = {}
-        self._cache_time: Dict[str, datetime] = {}
-    
-    def _is_cache_valid(self, key: str, max_age_seconds: int = 300) -> bool:
-        if key not in self._cache_time:
-            return False
-        age = (datetime.now() - self._cache_time[key]).total_seconds()
-        return age < max_age_seconds
+        # Bounded LRU+TTL response cache - distinct (state, limit,
+        # offset) keys can no longer accumulate without limit
+        self._cache = TTLCache(maxsize=256, ttl_seconds=settings.CACHE_TTL_SECONDS)
+        # Persistent pooled client - refresh fetches reuse keep-alive
+        # connections instead of paying DNS/TCP/TLS per request
+        self._client = httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+
+    async def aclose(self):
+        """Release pooled connections (called from app shutdown)"""
+        await self._client.aclose()
     
-    async def fetch_enrolment_data(self, limit: int = 1000, offset: int = 0, state: Optional[str] = None) -> Dict[str, Any]:
-        """Fetch real Aadhaar enrolment data from Data.gov.in"""
-        cache_key = f"enrolments_{state}_{limit}_{offset}"
-        
-        if self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
-        
+    def _build_params(self, limit: int, offset: int, state: Optional[str]) -> Dict[str, str]:
+        """Query parameters shared by the sync and async fetch paths"""
         params = {
             "api-key": self.api_key,
             "format": "json",
             "limit": str(limit),
             "offset": str(offset),
         }
-        
         if state:
             params["filters[state]"] = state
+        return params
+
+    def _store(self, cache_key: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a successful response under the given key"""
+        self._cache.put(cache_key, data)
+        return data
+
+    async def fetch_enrolment_data(self, limit: int = 1000, offset: int = 0, state: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch real Aadhaar enrolment data from Data.gov.in"""
+        cache_key = f"enrolments_{state}_{limit}_{offset}"
+
+        if (cached := self._cache.get(cache_key)) is not None:
+            return cached
         
         url = f"{self.BASE_URL}/{self.ENROLMENT_RESOURCE_ID}"
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                self._cache[cache_key] = data
-                self._cache_time[cache_key] = datetime.now()
-                
-                logger.info(f"Fetched {data.get('count', 0)} records from Data.gov.in")
-                return data
-                
+            response = await self._client.get(url, params=self._build_params(limit, offset, state))
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            logger.info(f"Fetched {data.get('count', 0)} records from Data.gov.in")
+            return self._store(cache_key, data)
+
         except Exception as e:
             logger.error(f"Error fetching from Data.gov.in: {e}")
             return {"records": [], "total": 0, "error": str(e)}
     
+    async def fetch_all(self, limit_per_page: int = 1000, max_records: int = 10000) -> List[Dict[str, Any]]:
+        """
+        Fetch the full enrolment dataset with bounded-concurrency pagination
+
+        The first page is fetched serially to learn the record total,
+        then the remaining pages run concurrently through the shared
+        pooled client, fan-out bounded by a semaphore.
+        """
+        first = await self.fetch_enrolment_data(limit=limit_per_page, offset=0)
+        all_records = list(first.get("records", []))
+        if not all_records:
+            return []
+
+        total = int(first.get("total", 0) or 0)
+        remaining = min(total if total else max_records, max_records)
+        offsets = range(limit_per_page, remaining, limit_per_page)
+        if not offsets:
+            return all_records[:max_records]
+
+        sem = asyncio.Semaphore(8)
+
+        async def fetch_page(offset: int) -> Dict[str, Any]:
+            async with sem:
+                return await self.fetch_enrolment_data(limit=limit_per_page, offset=offset)
+
+        pages = await asyncio.gather(*(fetch_page(o) for o in offsets))
+        for page in pages:
+            all_records.extend(page.get("records", []))
+
+        return all_records[:max_records]
+
     def fetch_enrolment_data_sync(self, limit: int = 1000, offset: int = 0, state: Optional[str] = None) -> Dict[str, Any]:
-        """Synchronous version for initialization"""
-        import requests
-        
+        """Synchronous version for initialization (startup only)"""
         cache_key = f"enrolments_{state}_{limit}_{offset}"
-        
-        if self._is_cache_valid(cache_key):
-            return self._cache[cache_key]
-        
-        params = {
-            "api-key": self.api_key,
-            "format": "json",
-            "limit": str(limit),
-            "offset": str(offset),
-        }
-        
-        if state:
-            params["filters[state]"] = state
+
+        if (cached := self._cache.get(cache_key)) is not None:
+            return cached
         
         url = f"{self.BASE_URL}/{self.ENROLMENT_RESOURCE_ID}"
         
         try:
-            response = requests.get(url, params=params, timeout=30)
+            # httpx.Client shares transport behaviour (and this module's
+            # only other HTTP dependency) with the async path; the old
+            # requests call was the lone use of that library
+            with httpx.Client(timeout=self.timeout) as client:
+                response = client.get(url, params=self._build_params(limit, offset, state))
             response.raise_for_status()
-            data = response.json()
-            
-            self._cache[cache_key] = data
-            self._cache_time[cache_key] = datetime.now()
-            
+            data = orjson.loads(response.content)
+
             logger.info(f"Fetched {data.get('count', 0)} records from Data.gov.in (sync)")
-            return data
-            
+            return self._store(cache_key, data)
+
         except Exception as e:
             logger.error(f"Error fetching from Data.gov.in: {e}")
             return {"records": [], "total": 0, "error": str(e)}
@@ -133,16 +277,34 @@ class AadhaarDataRepository:
         self._update_data: Optional[pd.DataFrame] = None
         self._demographics_data: Optional[Dict] = None
         self._state_data: Optional[pd.DataFrame] = None
+        self._state_records: Optional[List[Dict[str, Any]]] = None
+        self._state_columns: Optional[Dict[str, np.ndarray]] = None
+        self._region_index: Optional[Dict[str, np.ndarray]] = None
+        self._snapshot: Optional["RepoSnapshot"] = None
+        self._result_cache: Dict[str, tuple] = {}
+        self._monthly_updates: Optional[pd.Series] = None
         self._api_data: Optional[Dict] = None
         self._last_refresh: Optional[datetime] = None
+        self._version: int = 0
         self._data_source: DataSource = DataSource.SIMULATED
         self._total_api_records: int = 0
         
         self.fetcher = DataGovFetcher()
-        
-        # Initialize with real data
-        self._initialize_data()
-    
+        self._init_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """
+        Load data on first access instead of at construction, so
+        importing the module (tests, CLI tools, workers) never blocks on
+        a Data.gov.in round trip. Double-checked lock because accessors
+        are routinely called from asyncio.to_thread workers.
+        """
+        if self._last_refresh is not None:
+            return
+        with self._init_lock:
+            if self._last_refresh is None:
+                self._initialize_data()
+
     def _initialize_data(self):
         """Initialize repository with real Data.gov.in data"""
         logger.info("Initializing Aadhaar data repository with REAL Data.gov.in data...")
@@ -167,6 +329,26 @@ class AadhaarDataRepository:
             logger.error(f"Failed to fetch API data: {e}, using simulated data")
             self._generate_simulated_data()
         
+        # Normalize state codes once at ingest so request paths can use
+        # them as dict keys without per-request .upper() calls
+        if self._state_data is not None:
+            self._state_data["code"] = self._state_data["code"].str.upper()
+
+        # Invalidate the memoized record list/columns built from the old frame
+        self._state_records = None
+        self._state_columns = None
+        self._region_index = None
+
+        # Monthly update totals feed three getters - reduce once per load
+        self._monthly_updates = (
+            self._update_data.groupby("month", observed=True)["count"].sum()
+            if self._update_data is not None
+            else None
+        )
+
+        # Bump the data version so downstream memos keyed on it refresh
+        self._version += 1
+
         self._last_refresh = datetime.now()
         logger.info("Data repository initialized successfully")
     
@@ -178,12 +360,25 @@ class AadhaarDataRepository:
             self._generate_simulated_data()
             return
         
-        # Convert to DataFrame
-        df = pd.DataFrame(records)
-        
-        # Parse dates
+        # Convert to DataFrame - Arrow-backed when pyarrow is installed:
+        # dictionary-encoded strings and columnar buffers cut memory and
+        # speed up the state groupby over the default object columns
+        if pa is not None:
+            df = pa.Table.from_pylist(records).to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            df = pd.DataFrame(records)
+
+        # Int-coded Categorical state column: groupby hashes small ints
+        # instead of strings and the column stores one code per row.
+        # Unknown names are appended so no record is silently dropped.
+        if "state" in df.columns:
+            extras = [n for n in df["state"].unique() if n not in _STATE_CODES]
+            df["state"] = pd.Categorical(df["state"], categories=list(_STATE_CODES) + extras)
+
+        # Parse dates - cache=True dedupes parsing of repeated date
+        # strings (daily feeds have far fewer unique dates than rows)
         if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"], format="%d-%m-%Y", errors="coerce")
+            df["date"] = pd.to_datetime(df["date"], format="%d-%m-%Y", errors="coerce", cache=True)
         
         # Convert numeric columns
         numeric_cols = ["age_0_5", "age_5_17", "age_18_greater", "pincode"]
@@ -212,79 +407,41 @@ class AadhaarDataRepository:
             self._generate_simulated_state_data()
             return
         
-        # Aggregate by state
-        state_agg = df.groupby("state").agg({
+        # Aggregate by state (observed=True skips empty Categorical
+        # groups); the total is a cheap row-sum of the three age columns
+        # after aggregation rather than a fourth pass through the frame
+        state_agg = df.groupby("state", observed=True).agg({
             "age_0_5": "sum",
             "age_5_17": "sum",
             "age_18_greater": "sum",
-            "total_enrolments": "sum",
         }).reset_index()
-        
-        # Map state names to codes
-        state_codes = {
-            "Andhra Pradesh": ("AP", "South"),
-            "Arunachal Pradesh": ("AR", "Northeast"),
-            "Assam": ("AS", "Northeast"),
-            "Bihar": ("BR", "East"),
-            "Chhattisgarh": ("CG", "Central"),
-            "Delhi": ("DL", "North"),
-            "Goa": ("GA", "West"),
-            "Gujarat": ("GJ", "West"),
-            "Haryana": ("HR", "North"),
-            "Himachal Pradesh": ("HP", "North"),
-            "Jharkhand": ("JH", "East"),
-            "Karnataka": ("KA", "South"),
-            "Kerala": ("KL", "South"),
-            "Madhya Pradesh": ("MP", "Central"),
-            "Maharashtra": ("MH", "West"),
-            "Manipur": ("MN", "Northeast"),
-            "Meghalaya": ("ML", "Northeast"),
-            "Mizoram": ("MZ", "Northeast"),
-            "Nagaland": ("NL", "Northeast"),
-            "Odisha": ("OD", "East"),
-            "Punjab": ("PB", "North"),
-            "Rajasthan": ("RJ", "North"),
-            "Sikkim": ("SK", "Northeast"),
-            "Tamil Nadu": ("TN", "South"),
-            "Telangana": ("TS", "South"),
-            "Tripura": ("TR", "Northeast"),
-            "Uttar Pradesh": ("UP", "North"),
-            "Uttarakhand": ("UK", "North"),
-            "West Bengal": ("WB", "East"),
-            "Jammu & Kashmir": ("JK", "North"),
-            "Ladakh": ("LA", "North"),
-            "Andaman & Nicobar": ("AN", "Islands"),
-            "Chandigarh": ("CH", "North"),
-            "Dadra & Nagar Haveli": ("DN", "West"),
-            "Daman & Diu": ("DD", "West"),
-            "Lakshadweep": ("LD", "Islands"),
-            "Puducherry": ("PY", "South"),
-        }
-        
-        data = []
-        for _, row in state_agg.iterrows():
-            state_name = row["state"]
-            code, region = state_codes.get(state_name, ("XX", "Other"))
-            
-            # Scale up to realistic numbers (API has sample data)
-            scale_factor = self._total_api_records / max(1, len(df)) * 100
-            total = int(row["total_enrolments"] * scale_factor)
-            
-            data.append({
-                "name": state_name,
-                "code": code,
-                "region": region,
-                "total_enrolments": total,
-                "age_0_5": int(row["age_0_5"] * scale_factor),
-                "age_5_17": int(row["age_5_17"] * scale_factor),
-                "age_18_greater": int(row["age_18_greater"] * scale_factor),
-                "monthly_enrolments": int(total * 0.008),
-                "yoy_growth": round(np.random.uniform(5, 18), 1),
-                "update_rate": np.random.uniform(0.05, 0.12),
-                "urban_pct": np.random.uniform(0.25, 0.70),
-            })
-        
-        self._state_data = pd.DataFrame(data)
+        state_agg["total_enrolments"] = state_agg[
+            ["age_0_5", "age_5_17", "age_18_greater"]
+        ].sum(axis=1)
+        
+        # Scale up to realistic numbers (API has sample data) - column
+        # arithmetic and .map() joins replace the per-row iterrows build
+        scale_factor = self._total_api_records / max(1, len(df)) * 100
+        n = len(state_agg)
+        rng = np.random.default_rng()
+
+        total = (state_agg["total_enrolments"].to_numpy() * scale_factor).astype(np.int64)
+        # One batched draw for all three random columns
+        rand = rng.uniform([5, 0.05, 0.25], [18, 0.12, 0.70], size=(n, 3))
+
+        self._state_data = pd.DataFrame({
+            "name": state_agg["state"],
+            "code": state_agg["state"].map(_STATE_CODE_MAP).fillna("XX"),
+            "region": state_agg["state"].map(_STATE_REGION_MAP).fillna("Other"),
+            "total_enrolments": total,
+            "age_0_5": (state_agg["age_0_5"].to_numpy() * scale_factor).astype(np.int64),
+            "age_5_17": (state_agg["age_5_17"].to_numpy() * scale_factor).astype(np.int64),
+            "age_18_greater": (state_agg["age_18_greater"].to_numpy() * scale_factor).astype(np.int64),
+            "monthly_enrolments": (total * 0.008).astype(np.int64),
+            "yoy_growth": rand[:, 0].round(1),
+            "update_rate": rand[:, 1],
+            "urban_pct": rand[:, 2],
+        })
         
         # If we don't have all states, add missing ones
         if len(self._state_data) < 28:
@@ -294,44 +451,26 @@ class AadhaarDataRepository:
         """Add any missing states with estimated data"""
         existing_states = set(self._state_data["name"].tolist()) if self._state_data is not None else set()
         
-        all_states = [
-            ("Uttar Pradesh", "UP", "North", 185_000_000),
-            ("Maharashtra", "MH", "West", 128_000_000),
-            ("Bihar", "BR", "East", 112_000_000),
-            ("West Bengal", "WB", "East", 98_000_000),
-            ("Madhya Pradesh", "MP", "Central", 89_000_000),
-            ("Rajasthan", "RJ", "North", 82_000_000),
-            ("Tamil Nadu", "TN", "South", 78_000_000),
-            ("Karnataka", "KA", "South", 72_000_000),
-            ("Gujarat", "GJ", "West", 68_000_000),
-            ("Andhra Pradesh", "AP", "South", 52_000_000),
-            ("Odisha", "OD", "East", 48_000_000),
-            ("Telangana", "TS", "South", 42_000_000),
-            ("Kerala", "KL", "South", 38_000_000),
-            ("Jharkhand", "JH", "East", 35_000_000),
-            ("Assam", "AS", "Northeast", 32_000_000),
-            ("Punjab", "PB", "North", 30_000_000),
-        ]
-        
-        new_data = []
-        for name, code, region, enrolments in all_states:
-            if name not in existing_states:
-                new_data.append({
-                    "name": name,
-                    "code": code,
-                    "region": region,
-                    "total_enrolments": enrolments,
-                    "age_0_5": int(enrolments * 0.03),
-                    "age_5_17": int(enrolments * 0.20),
-                    "age_18_greater": int(enrolments * 0.77),
-                    "monthly_enrolments": int(enrolments * 0.008),
-                    "yoy_growth": round(np.random.uniform(5, 18), 1),
-                    "update_rate": np.random.uniform(0.05, 0.12),
-                    "urban_pct": np.random.uniform(0.25, 0.70),
-                })
-        
-        if new_data:
-            new_df = pd.DataFrame(new_data)
+        missing = [s for s in _ALL_STATES if s[0] not in existing_states]
+        if missing:
+            names, codes, regions, enrolments = zip(*missing)
+            enrolments = np.array(enrolments, dtype=np.int64)
+            rng = np.random.default_rng()
+            rand = rng.uniform([5, 0.05, 0.25], [18, 0.12, 0.70], size=(len(missing), 3))
+
+            new_df = pd.DataFrame({
+                "name": names,
+                "code": codes,
+                "region": regions,
+                "total_enrolments": enrolments,
+                "age_0_5": (enrolments * 0.03).astype(np.int64),
+                "age_5_17": (enrolments * 0.20).astype(np.int64),
+                "age_18_greater": (enrolments * 0.77).astype(np.int64),
+                "monthly_enrolments": (enrolments * 0.008).astype(np.int64),
+                "yoy_growth": rand[:, 0].round(1),
+                "update_rate": rand[:, 1],
+                "urban_pct": rand[:, 2],
+            })
             if self._state_data is not None:
                 self._state_data = pd.concat([self._state_data, new_df], ignore_index=True)
             else:
@@ -420,30 +559,36 @@ class AadhaarDataRepository:
         """Generate realistic monthly enrolment data"""
         months = pd.date_range(start="2020-01-01", end="2024-12-31", freq="MS")
         base_monthly = 12_000_000
-        
-        data = []
-        cumulative = 1_200_000_000
-        
-        for i, month in enumerate(months):
-            seasonal_factor = 1 + 0.15 * np.cos(2 * np.pi * (month.month - 1) / 12)
-            year_factor = 1 + max(0.02, 0.15 - 0.03 * (month.year - 2020))
-            random_factor = 1 + np.random.normal(0, 0.05)
-            
-            monthly_enrolments = int(base_monthly * seasonal_factor * year_factor * random_factor)
-            cumulative += monthly_enrolments
-            
-            data.append({
-                "month": month,
-                "year": month.year,
-                "month_num": month.month,
-                "enrolments": monthly_enrolments,
-                "cumulative": cumulative,
-                "yoy_growth": 0.0,
-            })
-        
-        df = pd.DataFrame(data)
-        df["yoy_growth"] = df["enrolments"].pct_change(periods=12) * 100
-        df["yoy_growth"] = df["yoy_growth"].fillna(0)
+
+        # Whole-series vectorized build: the seasonal/yearly/random
+        # factors are computed as arrays in one pass each instead of 60
+        # interpreter iterations appending per-row dicts
+        month_num = months.month.to_numpy()
+        year = months.year.to_numpy()
+        rng = np.random.default_rng()
+        random_noise = rng.normal(0, 0.05, size=months.size)
+
+        if njit is not None:
+            # Single fused LLVM-compiled pass over the series
+            enrolments, cumulative = _enrolment_kernel(
+                month_num, year, random_noise, base_monthly
+            )
+        else:
+            seasonal_factor = 1 + 0.15 * np.cos(2 * np.pi * (month_num - 1) / 12)
+            year_factor = 1 + np.maximum(0.02, 0.15 - 0.03 * (year - 2020))
+            enrolments = (
+                base_monthly * seasonal_factor * year_factor * (1 + random_noise)
+            ).astype(np.int64)
+            cumulative = 1_200_000_000 + enrolments.cumsum()
+
+        df = pd.DataFrame({
+            "month": months,
+            "year": year,
+            "month_num": month_num,
+            "enrolments": enrolments,
+            "cumulative": cumulative,
+        })
+        df["yoy_growth"] = (df["enrolments"].pct_change(periods=12) * 100).fillna(0)
         self._enrolment_data = df
     
     def _generate_update_data(self):
@@ -453,20 +598,30 @@ class AadhaarDataRepository:
             ("Address", 0.38), ("Mobile", 0.28), ("Email", 0.14),
             ("Biometric", 0.12), ("Photo", 0.05), ("Name", 0.02), ("Date of Birth", 0.01),
         ]
-        
-        data = []
-        for month in months:
-            base_updates = 7_000_000 * (1 + 0.05 * (month.year - 2020))
-            seasonal = 1 + 0.1 * np.cos(2 * np.pi * (month.month - 3) / 12)
-            total_updates = int(base_updates * seasonal * (1 + np.random.normal(0, 0.03)))
-            
-            for update_type, proportion in update_types:
-                type_count = int(total_updates * proportion * (1 + np.random.normal(0, 0.1)))
-                data.append({
-                    "month": month, "update_type": update_type, "count": type_count,
-                })
-        
-        self._update_data = pd.DataFrame(data)
+
+        # One broadcast over the (months x types) grid instead of 420
+        # interpreter iterations with a scalar normal draw apiece
+        types, props = zip(*update_types)
+        props = np.array(props)
+        rng = np.random.default_rng()
+
+        base_updates = 7_000_000 * (1 + 0.05 * (months.year.to_numpy() - 2020))
+        seasonal = 1 + 0.1 * np.cos(2 * np.pi * (months.month.to_numpy() - 3) / 12)
+        total_updates = (
+            base_updates * seasonal * (1 + rng.normal(0, 0.03, size=months.size))
+        ).astype(np.int64)
+
+        counts = (
+            total_updates[:, None]
+            * props[None, :]
+            * (1 + rng.normal(0, 0.1, size=(months.size, props.size)))
+        ).astype(np.int64)
+
+        self._update_data = pd.DataFrame({
+            "month": np.repeat(months, len(types)),
+            "update_type": np.tile(types, months.size),
+            "count": counts.ravel(),
+        })
     
     def _generate_demographics_data(self):
         """Generate demographic distribution data"""
@@ -514,32 +669,71 @@ class AadhaarDataRepository:
             ("Delhi", "DL", "North", 22_000_000),
         ]
         
-        data = []
-        for name, code, region, enrolments in states_info:
-            data.append({
-                "name": name,
-                "code": code,
-                "region": region,
-                "total_enrolments": enrolments,
-                "monthly_enrolments": int(enrolments * 0.008),
-                "yoy_growth": round(np.random.uniform(5, 18), 1),
-                "update_rate": np.random.uniform(0.05, 0.12),
-                "urban_pct": np.random.uniform(0.25, 0.70),
-            })
-        
-        self._state_data = pd.DataFrame(data)
+        names, codes, regions, enrolments = zip(*states_info)
+        enrolments = np.array(enrolments, dtype=np.int64)
+        rng = np.random.default_rng()
+        rand = rng.uniform([5, 0.05, 0.25], [18, 0.12, 0.70], size=(len(states_info), 3))
+
+        self._state_data = pd.DataFrame({
+            "name": names,
+            "code": codes,
+            "region": regions,
+            "total_enrolments": enrolments,
+            "monthly_enrolments": (enrolments * 0.008).astype(np.int64),
+            "yoy_growth": rand[:, 0].round(1),
+            "update_rate": rand[:, 1],
+            "urban_pct": rand[:, 2],
+        })
     
     # Public Data Access Methods
-    
+
+    def _memo(self, key: str, fn):
+        """
+        Version-keyed result memo for the public getters - the pandas
+        aggregation behind each one only changes when the data refreshes,
+        so repeated HTTP hits between refreshes get the cached list/dict
+        instead of re-running groupby/sort/strftime work.
+        """
+        hit = self._result_cache.get(key)
+        if hit is not None and hit[0] == self._version:
+            return hit[1]
+        value = fn()
+        self._result_cache[key] = (self._version, value)
+        return value
+
+    def _memo_json(self, key: str, fn) -> bytes:
+        """
+        Like _memo, but also caches the orjson-encoded bytes of the
+        result so hot endpoints can splice them straight into a
+        Response - JSON encoding happens once per refresh instead of
+        once per request.
+        """
+        json_key = f"{key}:json"
+        hit = self._result_cache.get(json_key)
+        if hit is not None and hit[0] == self._version:
+            return hit[1]
+        body = orjson.dumps(self._memo(key, fn))
+        self._result_cache[json_key] = (self._version, body)
+        return body
+
     def get_summary_stats(self) -> Dict[str, Any]:
         """Get high-level summary statistics"""
+        self._ensure_loaded()
+        return self._memo("summary_stats", self._compute_summary_stats)
+
+    def get_summary_stats_json(self) -> bytes:
+        """Summary statistics as pre-serialized JSON bytes"""
+        self._ensure_loaded()
+        return self._memo_json("summary_stats", self._compute_summary_stats)
+
+    def _compute_summary_stats(self) -> Dict[str, Any]:
         latest_cumulative = self._enrolment_data["cumulative"].iloc[-1] if self._enrolment_data is not None else 1_450_000_000
         latest_monthly = self._enrolment_data["enrolments"].iloc[-1] if self._enrolment_data is not None else 12_500_000
         latest_yoy = self._enrolment_data["yoy_growth"].iloc[-1] if self._enrolment_data is not None else 8.5
         
         total_updates = 0
-        if self._update_data is not None:
-            total_updates = self._update_data.groupby("month")["count"].sum().iloc[-1] if len(self._update_data) > 0 else 8_000_000
+        if self._monthly_updates is not None:
+            total_updates = self._monthly_updates.iloc[-1] if len(self._monthly_updates) > 0 else 8_000_000
         
         return {
             "total_enrolments": int(latest_cumulative),
@@ -554,36 +748,55 @@ class AadhaarDataRepository:
             "last_refresh": self._last_refresh.isoformat() if self._last_refresh else None,
         }
     
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every data (re)load - memo key"""
+        self._ensure_loaded()
+        return self._version
+
     def get_enrolment_timeseries(self, months: int = 24) -> List[Dict[str, Any]]:
+        self._ensure_loaded()
+        return self._memo(
+            f"enrolment_ts_{months}", lambda: self._compute_enrolment_timeseries(months)
+        )
+
+    def _compute_enrolment_timeseries(self, months: int) -> List[Dict[str, Any]]:
         if self._enrolment_data is None:
             return []
-        df = self._enrolment_data.tail(months).copy()
-        return [
-            {
-                "period": row["month"].strftime("%Y-%m"),
-                "month_name": row["month"].strftime("%b %Y"),
-                "value": int(row["enrolments"]),
-                "cumulative": int(row["cumulative"]),
-                "yoy_growth": round(float(row["yoy_growth"]), 2),
-            }
-            for _, row in df.iterrows()
-        ]
+        tail = self._enrolment_data.tail(months)
+        # Vectorized strftime over the month column - per-row Timestamp
+        # formatting was the dominant cost of this hot endpoint
+        out = pd.DataFrame({
+            "period": tail["month"].dt.strftime("%Y-%m"),
+            "month_name": tail["month"].dt.strftime("%b %Y"),
+            "value": tail["enrolments"].astype(int),
+            "cumulative": tail["cumulative"].astype(int),
+            "yoy_growth": tail["yoy_growth"].round(2),
+        })
+        return out.to_dict("records")
     
     def get_update_timeseries(self, months: int = 24) -> List[Dict[str, Any]]:
-        if self._update_data is None:
+        self._ensure_loaded()
+        return self._memo(
+            f"update_ts_{months}", lambda: self._compute_update_timeseries(months)
+        )
+
+    def _compute_update_timeseries(self, months: int) -> List[Dict[str, Any]]:
+        if self._monthly_updates is None:
             return []
-        df = self._update_data.groupby("month")["count"].sum().reset_index()
-        df = df.tail(months)
-        return [
-            {
-                "period": row["month"].strftime("%Y-%m"),
-                "month_name": row["month"].strftime("%b %Y"),
-                "value": int(row["count"]),
-            }
-            for _, row in df.iterrows()
-        ]
+        tail = self._monthly_updates.reset_index().tail(months)
+        out = pd.DataFrame({
+            "period": tail["month"].dt.strftime("%Y-%m"),
+            "month_name": tail["month"].dt.strftime("%b %Y"),
+            "value": tail["count"].astype(int),
+        })
+        return out.to_dict("records")
     
     def get_update_types(self) -> List[Dict[str, Any]]:
+        self._ensure_loaded()
+        return self._memo("update_types", self._compute_update_types)
+
+    def _compute_update_types(self) -> List[Dict[str, Any]]:
         if self._update_data is None:
             return []
         latest_month = self._update_data["month"].max()
@@ -599,39 +812,123 @@ class AadhaarDataRepository:
         ]
     
     def get_state_data(self) -> List[Dict[str, Any]]:
+        self._ensure_loaded()
         if self._state_data is None:
             return []
-        return self._state_data.sort_values("total_enrolments", ascending=False).to_dict("records")
+        # Sort and convert once per data refresh - callers treat the
+        # shared list as read-only
+        if self._state_records is None:
+            self._state_records = self._state_data.sort_values(
+                "total_enrolments", ascending=False
+            ).to_dict("records")
+        return self._state_records
     
+    def get_states_by_code(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Upper-cased code -> state record index over get_state_data(),
+        memoized per data version so code lookups are O(1) dict hits.
+        Shared by the enrolment and geography routers.
+        """
+        return self._memo(
+            "states_by_code",
+            lambda: {s["code"]: s for s in self.get_state_data()},
+        )
+
+    def get_state_columns(self) -> Dict[str, np.ndarray]:
+        """
+        State table as parallel column arrays (SoA), sorted by total
+        enrolments descending like get_state_data(). Aggregate scans
+        (sum/max/argsort) run as C-loop primitives over these instead of
+        hashing into per-row dicts. Memoized until the next data refresh.
+        """
+        self._ensure_loaded()
+        if self._state_data is None:
+            return {}
+        if self._state_columns is None:
+            df = self._state_data.sort_values("total_enrolments", ascending=False)
+            self._state_columns = {
+                "code": df["code"].to_numpy(),
+                "name": df["name"].to_numpy(),
+                "region": df["region"].to_numpy(),
+                "total_enrolments": df["total_enrolments"].to_numpy(dtype=np.int64),
+                "monthly_enrolments": df["monthly_enrolments"].to_numpy(dtype=np.int64),
+                "yoy_growth": df["yoy_growth"].to_numpy(dtype=np.float64),
+                "urban_pct": df["urban_pct"].to_numpy(dtype=np.float64),
+                "update_rate": df["update_rate"].to_numpy(dtype=np.float64),
+            }
+        return self._state_columns
+
+    def get_snapshot(self) -> RepoSnapshot:
+        """
+        Fused per-version view: summary, trends, demographics, state
+        records and state columns computed together and cached until the
+        next data refresh. One call, one memo check, for the composers
+        that previously issued four separate reads.
+        """
+        self._ensure_loaded()
+        if self._snapshot is None or self._snapshot.version != self._version:
+            self._snapshot = RepoSnapshot(
+                version=self._version,
+                summary=self.get_summary_stats(),
+                trends=self.get_trends(),
+                demographics=self.get_demographics(),
+                states=self.get_state_data(),
+                state_cols=self.get_state_columns(),
+            )
+        return self._snapshot
+
+    def get_region_index(self) -> Dict[str, np.ndarray]:
+        """
+        region -> integer row positions into the get_state_columns()
+        arrays. Built once per data refresh so per-request region
+        aggregation is a fancy-index + sum instead of a Python grouping
+        loop over every state.
+        """
+        if self._region_index is None:
+            regions = self.get_state_columns().get("region")
+            if regions is None:
+                return {}
+            self._region_index = {
+                region: np.nonzero(regions == region)[0]
+                for region in np.unique(regions)
+            }
+        return self._region_index
+
     def get_demographics(self) -> Dict[str, Any]:
+        self._ensure_loaded()
         return self._demographics_data or {}
     
     def get_trends(self) -> Dict[str, Any]:
+        self._ensure_loaded()
+        return self._memo("trends", self._compute_trends)
+
+    def _compute_trends(self) -> Dict[str, Any]:
         if self._enrolment_data is None:
             return {}
         df = self._enrolment_data.tail(24)
-        recent_12m = df.tail(12)["enrolments"].mean()
-        prev_12m = df.head(12)["enrolments"].mean()
+        enrolments = df["enrolments"].to_numpy()
+        months = df["month"]
+        recent_12m = enrolments[-12:].mean()
+        prev_12m = enrolments[:12].mean()
         
         update_recent = 8_400_000
         update_prev = 7_000_000
-        if self._update_data is not None:
-            update_df = self._update_data.groupby("month")["count"].sum().reset_index()
-            if len(update_df) >= 24:
-                update_recent = update_df.tail(12)["count"].mean()
-                update_prev = update_df.head(12)["count"].mean()
+        if self._monthly_updates is not None and len(self._monthly_updates) >= 24:
+            update_recent = self._monthly_updates.tail(12).mean()
+            update_prev = self._monthly_updates.head(12).mean()
         
         return {
             "enrolment_growth_yoy": round((recent_12m - prev_12m) / prev_12m * 100, 1),
             "update_growth_yoy": round((update_recent - update_prev) / update_prev * 100, 1),
             "daily_average_enrolments": int(recent_12m / 30),
             "daily_average_updates": int(update_recent / 30),
-            "peak_month": df.loc[df["enrolments"].idxmax(), "month"].strftime("%b %Y"),
-            "lowest_month": df.loc[df["enrolments"].idxmin(), "month"].strftime("%b %Y"),
+            "peak_month": months.iloc[enrolments.argmax()].strftime("%b %Y"),
+            "lowest_month": months.iloc[enrolments.argmin()].strftime("%b %Y"),
         }
     
     def get_api_metadata(self) -> Dict[str, Any]:
         """Get metadata about the Data.gov.in connection"""
+        self._ensure_loaded()
         return {
             "data_source": self._data_source.value,
             "total_records_available": self._total_api_records,
@@ -642,5 +939,22 @@ class AadhaarDataRepository:
         }
 
 
-# Singleton instance
-aadhaar_repository = AadhaarDataRepository()
+# Lazily constructed singleton - importing this module has no side
+# effects; the first data access (usually the startup warm-up) triggers
+# the actual load via _ensure_loaded.
+_repository: Optional[AadhaarDataRepository] = None
+
+
+def get_repository() -> AadhaarDataRepository:
+    global _repository
+    if _repository is None:
+        _repository = AadhaarDataRepository()
+    return _repository
+
+
+def __getattr__(name: str):
+    # Keeps `from services.data_repository import aadhaar_repository`
+    # call sites working without constructing the repository at import
+    if name == "aadhaar_repository":
+        return get_repository()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,7 +3,9 @@ Recommendation Engine
 Policy recommendations based on data analysis
 """
 import numpy as np
-from typing import Dict, List, Any
+from itertools import count
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 from enum import Enum
@@ -11,11 +13,12 @@ import logging
 from services.data_repository import aadhaar_repository
 from services.analytics_service import analytics_service
 from services.anomaly_engine import anomaly_engine
+from services._state_kernels import top_by_field
 
 logger = logging.getLogger(__name__)
 
 
-class RecommendationCategory(Enum):
+class RecommendationCategory(str, Enum):
     INFRASTRUCTURE = "Infrastructure"
     POLICY = "Policy"
     OPERATIONS = "Operations"
@@ -23,13 +26,118 @@ class RecommendationCategory(Enum):
     OUTREACH = "Outreach"
 
 
-class RecommendationStatus(Enum):
+class RecommendationStatus(str, Enum):
     NEW = "new"
     IN_PROGRESS = "in_progress"
     IMPLEMENTED = "implemented"
     REJECTED = "rejected"
 
 
+# Invariant payload fragments, built once at import - the builders merge
+# these with the per-emission dynamic fields instead of re-allocating
+# the full literal every call. Tuples/shared dicts are safe because
+# callers never mutate emitted recommendations.
+_INFRA_TMPL = {
+    "category": RecommendationCategory.INFRASTRUCTURE,
+    "priority": "high",
+    "status": "new",
+    "resource_requirement": {
+        "budget": "₹25-30 Cr",
+        "timeline": "6-9 months",
+        "new_centres": "50-75",
+    },
+}
+
+_OPERATIONAL_TMPL = {
+    "title": "Implement Express Update Lanes",
+    "category": RecommendationCategory.OPERATIONS,
+    "priority": "medium",
+    "status": "in_progress",
+    "summary": "Create dedicated express lanes for simple updates (mobile, email) to reduce queue times and improve throughput in high-traffic centres.",
+    "expected_impact": {
+        "throughput_increase": "40%",
+        "average_wait_time": "-45 minutes",
+        "staff_efficiency": "+25%",
+    },
+    "resource_requirement": {
+        "budget": "₹5-8 Cr",
+        "timeline": "2-3 months",
+        "training": "500 operators",
+    },
+}
+
+_OUTREACH_TMPL = {
+    "title": "Rural Outreach Campaign",
+    "category": RecommendationCategory.OUTREACH,
+    "priority": "medium",
+    "status": "new",
+    "expected_impact": {
+        "new_enrolments": "500K-800K",
+        "coverage_increase": "+5% national",
+        "inclusion_index": "+8 points",
+    },
+    "resource_requirement": {
+        "budget": "₹15-20 Cr",
+        "timeline": "12 months",
+        "mobile_units": "100",
+    },
+}
+
+_TECHNOLOGY_TMPL = {
+    "title": "Deploy Self-Service Update Kiosks",
+    "category": RecommendationCategory.TECHNOLOGY,
+    "priority": "high",
+    "status": "in_progress",
+    "summary": "Install self-service kiosks at high-traffic locations for simple updates like mobile and email, reducing operator workload.",
+    "rationale": (
+        "Mobile/Email updates: 42% of all updates",
+        "These require minimal verification",
+        "Can be self-served with OTP authentication",
+    ),
+    "expected_impact": {
+        "operator_load_reduction": "30%",
+        "cost_per_transaction": "-60%",
+        "24x7_availability": "Yes",
+    },
+    "resource_requirement": {
+        "budget": "₹40-50 Cr",
+        "timeline": "9-12 months",
+        "kiosks": "5000 units",
+    },
+}
+
+
+# Prose templates compiled once at import, filled with format_map per
+# emission - same convention as the insight engine
+_INFRA_TITLE = "Expand Enrolment Centres in {name}"
+_INFRA_SUMMARY = "With {monthly:,} monthly transactions, {name} requires additional permanent and mobile enrolment centres to maintain service quality."
+_INFRA_RATIONALE_VOLUME = "Current volume: {monthly:,}/month"
+_INFRA_RATIONALE_GROWTH = "YoY growth: {yoy:.1f}%"
+_INFRA_COVERAGE = "{name} +15%"
+
+_OPERATIONAL_RATIONALE_INDEX = "Update fatigue index: {index:.2f}"
+_OPERATIONAL_RATIONALE_TOP = "Top affected: {district}"
+
+_OUTREACH_SUMMARY = "Deploy mobile enrolment vans in {count} states with rural coverage below 40% to reach underserved populations."
+_OUTREACH_RATIONALE = "{count} states with <40% urban coverage"
+
+
+@dataclass(slots=True, frozen=True)
+class Recommendation:
+    """One emitted recommendation - slotted and frozen, mirroring the
+    Insight record; converted to dicts at the router boundary."""
+    id: str
+    title: str
+    category: str
+    priority: str
+    status: str
+    summary: str
+    rationale: Tuple[str, ...]
+    expected_impact: Dict[str, str]
+    resource_requirement: Dict[str, str]
+    generated_at: str
+
+
 class RecommendationEngine:
     """
     Generates data-driven policy recommendations.
@@ -39,73 +147,122 @@ class RecommendationEngine:
         self.repo = aadhaar_repository
         self.analytics = analytics_service
         self.anomaly_detector = anomaly_engine
-        self._rec_counter = 0
+        self._id_seq = count(1)
+        # (repo data version, sorted recommendations, stats) - same
+        # memo shape as the insight engine; rebuilt only when the data
+        # reloads
+        self._recs_cache: Optional[tuple] = None
     
-    def _generate_rec_id(self) -> str:
-        """Generate unique recommendation ID"""
-        self._rec_counter += 1
-        return f"REC-{datetime.now().strftime('%Y')}-{self._rec_counter:03d}"
+    def _generate_rec_id(self, prefix: str) -> str:
+        """Generate unique recommendation ID (prefix computed per batch)"""
+        return f"{prefix}-{next(self._id_seq):03d}"
     
-    def generate_all_recommendations(self) -> List[Dict[str, Any]]:
-        """Generate all policy recommendations"""
+    def _build_all_recommendations(self) -> tuple:
+        """Run every builder, order and summarize - memoized per data
+        version; returns (recommendations, stats)"""
+        version = self.repo.version
+        if self._recs_cache is not None and self._recs_cache[0] == version:
+            return self._recs_cache[1], self._recs_cache[2]
+
+        # One timestamp per batch, shared by every emitted record
+        now = datetime.now()
+        now_iso = now.isoformat()
+        id_prefix = f"REC-{now.strftime('%Y')}"
+
+        # Fetch the shared state columns once - two builders filter them
+        cols = self.repo.get_state_columns()
+
         recommendations = []
         
         # Infrastructure recommendations
-        recommendations.extend(self._infrastructure_recommendations())
+        recommendations.extend(self._infrastructure_recommendations(cols, now_iso, id_prefix))
         
         # Operational recommendations
-        recommendations.extend(self._operational_recommendations())
+        recommendations.extend(self._operational_recommendations(now_iso, id_prefix))
         
         # Outreach recommendations
-        recommendations.extend(self._outreach_recommendations())
+        recommendations.extend(self._outreach_recommendations(cols, now_iso, id_prefix))
         
         # Technology recommendations
-        recommendations.extend(self._technology_recommendations())
-        
-        # Sort by priority
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        recommendations.sort(key=lambda x: priority_order.get(x["priority"], 3))
-        
+        recommendations.extend(self._technology_recommendations(now_iso, id_prefix))
+
+        # One O(N) bucket pass replaces the lambda-per-comparison sort;
+        # the three known levels come first, anything unexpected trails
+        # in first-seen order
+        buckets = {"high": [], "medium": [], "low": []}
+        for rec in recommendations:
+            buckets.setdefault(rec.priority, []).append(rec)
+        recommendations = [r for level in buckets for r in buckets[level]]
+
+        # Stats drop out of the same pass - the bucket lengths are the
+        # priority counts - so the stats endpoint is a memo hit too
+        stats = {
+            "total_recommendations": len(recommendations),
+            "by_category": dict(Counter(r.category for r in recommendations)),
+            "by_status": {"new": 0, "in_progress": 0, "implemented": 0,
+                          **Counter(r.status for r in recommendations)},
+            "by_priority": {level: len(members) for level, members in buckets.items()},
+            "generated_at": now_iso,
+        }
+
+        self._recs_cache = (version, recommendations, stats)
+        return recommendations, stats
+
+    def generate_all_recommendations(
+        self,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+    ) -> List[Recommendation]:
+        """Generate all policy recommendations, optionally filtered"""
+        recommendations = self._build_all_recommendations()[0]
+
+        # Filters select from the cached sorted list; records are frozen,
+        # so the unfiltered path shares the reference
+        if category:
+            category = category.lower()
+            recommendations = [r for r in recommendations if r.category.lower() == category]
+        if status:
+            recommendations = [r for r in recommendations if r.status == status]
+
         return recommendations
     
-    def _infrastructure_recommendations(self) -> List[Dict[str, Any]]:
+    def _infrastructure_recommendations(self, cols: Dict[str, Any], now_iso: str, id_prefix: str) -> List[Recommendation]:
         """Generate infrastructure-related recommendations"""
         recommendations = []
-        states = self.repo.get_state_data()
-        
-        # Find high-demand states
-        high_demand = [s for s in states if s["monthly_enrolments"] > 1_000_000]
-        
-        if high_demand:
-            top = max(high_demand, key=lambda x: x["monthly_enrolments"])
-            recommendations.append({
-                "id": self._generate_rec_id(),
-                "title": f"Expand Enrolment Centres in {top['name']}",
-                "category": RecommendationCategory.INFRASTRUCTURE.value,
-                "priority": "high",
-                "status": "new",
-                "summary": f"With {top['monthly_enrolments']:,} monthly transactions, {top['name']} requires additional permanent and mobile enrolment centres to maintain service quality.",
-                "rationale": [
-                    f"Current volume: {top['monthly_enrolments']:,}/month",
-                    f"YoY growth: {top['yoy_growth']:.1f}%",
+        if not cols:
+            return recommendations
+
+        # Masked argmax over the SoA columns via the compiled kernel
+        monthly = cols["monthly_enrolments"].astype(np.float64)
+        top_idx = int(top_by_field(monthly, monthly > 1_000_000.0))
+
+        if top_idx >= 0:
+            vals = {
+                "name": cols["name"][top_idx],
+                "monthly": int(cols["monthly_enrolments"][top_idx]),
+                "yoy": float(cols["yoy_growth"][top_idx]),
+            }
+            recommendations.append(Recommendation(
+                **_INFRA_TMPL,
+                id=self._generate_rec_id(id_prefix),
+                title=_INFRA_TITLE.format_map(vals),
+                summary=_INFRA_SUMMARY.format_map(vals),
+                rationale=(
+                    _INFRA_RATIONALE_VOLUME.format_map(vals),
+                    _INFRA_RATIONALE_GROWTH.format_map(vals),
                     "Wait times exceeding SLA in metro districts",
-                ],
-                "expected_impact": {
+                ),
+                expected_impact={
                     "wait_time_reduction": "35%",
-                    "coverage_increase": f"{top['name']} +15%",
+                    "coverage_increase": _INFRA_COVERAGE.format_map(vals),
                     "customer_satisfaction": "+12 NPS points",
                 },
-                "resource_requirement": {
-                    "budget": "₹25-30 Cr",
-                    "timeline": "6-9 months",
-                    "new_centres": "50-75",
-                },
-                "generated_at": datetime.now().isoformat(),
-            })
+                generated_at=now_iso,
+            ))
         
         return recommendations
     
-    def _operational_recommendations(self) -> List[Dict[str, Any]]:
+    def _operational_recommendations(self, now_iso: str, id_prefix: str) -> List[Recommendation]:
         """Generate operational recommendations"""
         recommendations = []
         update_analytics = self.analytics.get_update_analytics()
@@ -114,121 +271,58 @@ class RecommendationEngine:
         if fatigue.get("national_index", 0) > 0.65:
             high_fatigue = fatigue.get("high_fatigue_districts", [])
             if high_fatigue:
-                recommendations.append({
-                    "id": self._generate_rec_id(),
-                    "title": "Implement Express Update Lanes",
-                    "category": RecommendationCategory.OPERATIONS.value,
-                    "priority": "medium",
-                    "status": "in_progress",
-                    "summary": "Create dedicated express lanes for simple updates (mobile, email) to reduce queue times and improve throughput in high-traffic centres.",
-                    "rationale": [
-                        f"Update fatigue index: {fatigue.get('national_index', 0.72):.2f}",
-                        f"Top affected: {high_fatigue[0]['district']}",
+                recommendations.append(Recommendation(
+                    **_OPERATIONAL_TMPL,
+                    id=self._generate_rec_id(id_prefix),
+                    rationale=(
+                        _OPERATIONAL_RATIONALE_INDEX.format_map({"index": fatigue.get("national_index", 0.72)}),
+                        _OPERATIONAL_RATIONALE_TOP.format_map({"district": high_fatigue[0]["district"]}),
                         "Simple updates taking same time as complex ones",
-                    ],
-                    "expected_impact": {
-                        "throughput_increase": "40%",
-                        "average_wait_time": "-45 minutes",
-                        "staff_efficiency": "+25%",
-                    },
-                    "resource_requirement": {
-                        "budget": "₹5-8 Cr",
-                        "timeline": "2-3 months",
-                        "training": "500 operators",
-                    },
-                    "generated_at": datetime.now().isoformat(),
-                })
+                    ),
+                    generated_at=now_iso,
+                ))
         
         return recommendations
     
-    def _outreach_recommendations(self) -> List[Dict[str, Any]]:
+    def _outreach_recommendations(self, cols: Dict[str, Any], now_iso: str, id_prefix: str) -> List[Recommendation]:
         """Generate outreach recommendations"""
         recommendations = []
-        states = self.repo.get_state_data()
-        
-        # Find states with low urban coverage
-        low_urban = [s for s in states if s["urban_pct"] < 0.4]
-        
-        if low_urban:
-            recommendations.append({
-                "id": self._generate_rec_id(),
-                "title": "Rural Outreach Campaign",
-                "category": RecommendationCategory.OUTREACH.value,
-                "priority": "medium",
-                "status": "new",
-                "summary": f"Deploy mobile enrolment vans in {len(low_urban)} states with rural coverage below 40% to reach underserved populations.",
-                "rationale": [
-                    f"{len(low_urban)} states with <40% urban coverage",
+        if not cols:
+            return recommendations
+
+        # Count of low-urban-coverage states straight from the mask
+        low_urban_count = int((cols["urban_pct"] < 0.4).sum())
+
+        if low_urban_count:
+            recommendations.append(Recommendation(
+                **_OUTREACH_TMPL,
+                id=self._generate_rec_id(id_prefix),
+                summary=_OUTREACH_SUMMARY.format_map({"count": low_urban_count}),
+                rationale=(
+                    _OUTREACH_RATIONALE.format_map({"count": low_urban_count}),
                     "Rural saturation estimated at 85% vs 99% urban",
                     "Last mile coverage gap identified",
-                ],
-                "expected_impact": {
-                    "new_enrolments": "500K-800K",
-                    "coverage_increase": "+5% national",
-                    "inclusion_index": "+8 points",
-                },
-                "resource_requirement": {
-                    "budget": "₹15-20 Cr",
-                    "timeline": "12 months",
-                    "mobile_units": "100",
-                },
-                "generated_at": datetime.now().isoformat(),
-            })
+                ),
+                generated_at=now_iso,
+            ))
         
         return recommendations
     
-    def _technology_recommendations(self) -> List[Dict[str, Any]]:
+    def _technology_recommendations(self, now_iso: str, id_prefix: str) -> List[Recommendation]:
         """Generate technology recommendations"""
         recommendations = []
         
-        recommendations.append({
-            "id": self._generate_rec_id(),
-            "title": "Deploy Self-Service Update Kiosks",
-            "category": RecommendationCategory.TECHNOLOGY.value,
-            "priority": "high",
-            "status": "in_progress",
-            "summary": "Install self-service kiosks at high-traffic locations for simple updates like mobile and email, reducing operator workload.",
-            "rationale": [
-                "Mobile/Email updates: 42% of all updates",
-                "These require minimal verification",
-                "Can be self-served with OTP authentication",
-            ],
-            "expected_impact": {
-                "operator_load_reduction": "30%",
-                "cost_per_transaction": "-60%",
-                "24x7_availability": "Yes",
-            },
-            "resource_requirement": {
-                "budget": "₹40-50 Cr",
-                "timeline": "9-12 months",
-                "kiosks": "5000 units",
-            },
-            "generated_at": datetime.now().isoformat(),
-        })
+        recommendations.append(Recommendation(
+            **_TECHNOLOGY_TMPL,
+            id=self._generate_rec_id(id_prefix),
+            generated_at=now_iso,
+        ))
         
         return recommendations
     
     def get_recommendation_stats(self) -> Dict[str, Any]:
-        """Get summary statistics about recommendations"""
-        recommendations = self.generate_all_recommendations()
-        
-        by_category = {}
-        by_status = {"new": 0, "in_progress": 0, "implemented": 0}
-        by_priority = {"high": 0, "medium": 0, "low": 0}
-        
-        for rec in recommendations:
-            cat = rec["category"]
-            by_category[cat] = by_category.get(cat, 0) + 1
-            by_status[rec["status"]] = by_status.get(rec["status"], 0) + 1
-            by_priority[rec["priority"]] = by_priority.get(rec["priority"], 0) + 1
-        
-        return {
-            "total_recommendations": len(recommendations),
-            "by_category": by_category,
-            "by_status": by_status,
-            "by_priority": by_priority,
-            "generated_at": datetime.now().isoformat(),
-        }
+        """Get summary statistics about recommendations (built with the batch)"""
+        return self._build_all_recommendations()[1]
 
 
 # Singleton instance
@@ -0,0 +1,114 @@
+"""
+TTL Cache
+Small LRU-with-TTL cache for expensive service responses
+"""
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from config import settings
+
+
+class TTLCache:
+    """
+    LRU cache with per-entry TTL expiry.
+
+    Used to memoize Gemini analysis responses: the underlying dashboard
+    data changes at most every CACHE_TTL_SECONDS, so repeat calls within
+    the window are served from memory instead of re-invoking the LLM.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl_seconds if ttl_seconds is not None else settings.CACHE_TTL_SECONDS
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @staticmethod
+    def make_key(endpoint: str, data: Any = None) -> str:
+        """Build a stable cache key from endpoint name and input data"""
+        payload = json.dumps(data, sort_keys=True, default=str).encode()
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        return f"{endpoint}:{digest}"
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.miss_count += 1
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() > expires_at:
+            # Shared across to_thread workers - a racing thread may have
+            # already dropped the expired entry, so never hard-delete
+            self._entries.pop(key, None)
+            self.miss_count += 1
+            return None
+
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # Concurrently evicted between the read and the LRU bump;
+            # the value we already hold is still good to serve
+            pass
+        self.hit_count += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+        }
+
+
+class SingleFlight:
+    """
+    Async single-flight TTL memo around one expensive sync computation.
+
+    N concurrent awaiters within the TTL share a single run of ``fn``
+    (sync callables execute off the event loop in a worker thread,
+    coroutine functions are awaited directly); everyone else is served
+    the memoized value until it expires. Used by routers whose
+    handlers all fan in to the same service aggregate.
+    """
+
+    def __init__(self, fn: Callable[[], Any], ttl_seconds: float = 15.0):
+        self._fn = fn
+        self._ttl = ttl_seconds
+        self._value: Any = None
+        self._time: float = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Any:
+        now = time.monotonic()
+        if self._value is not None and now - self._time <= self._ttl:
+            return self._value
+
+        async with self._lock:
+            # Double-check: another awaiter may have refreshed while we
+            # waited on the lock
+            now = time.monotonic()
+            if self._value is None or now - self._time > self._ttl:
+                if asyncio.iscoroutinefunction(self._fn):
+                    self._value = await self._fn()
+                else:
+                    self._value = await asyncio.to_thread(self._fn)
+                self._time = time.monotonic()
+        return self._value
+
+
+# Shared cache for AI analysis responses
+ai_response_cache = TTLCache(maxsize=256)